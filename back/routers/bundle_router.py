@@ -19,12 +19,13 @@ from ..models.bundle_models import (
     BundleInstallResponse, BundleDuplicateRequest
 )
 from ..utils.logger import get_logger
+from ..utils.json_utils import FastJSONResponse
 
 # Initialize logger
 logger = get_logger(__name__)
 
 # Create router
-router = APIRouter(prefix="/api/bundles", tags=["bundles"])
+router = APIRouter(prefix="/api/bundles", tags=["bundles"], default_response_class=FastJSONResponse)
 
 # Initialize service
 bundle_service = BundleService()
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Body, Request
+from fastapi.concurrency import run_in_threadpool
 from back.services.download_service import DownloadService
 from back.services.token_service import TokenService
 from back.services.auth_middleware import protected
@@ -55,7 +56,8 @@ async def download_models(
         raise HTTPException(status_code=400, detail="Invalid input format")
     
     try:
-        results = DownloadService.download_models(entries, hf_token, civitai_token)
+        # Path resolution and directory creation are blocking: keep them off the event loop
+        results = await run_in_threadpool(DownloadService.download_models, entries, hf_token, civitai_token)
         return results[0] if is_single else results
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -114,7 +116,8 @@ async def delete_models(
         raise HTTPException(status_code=400, detail="Invalid input format")
     
     try:
-        results = DownloadService.delete_models(entries)
+        # File and directory removal blocks; keep it off the event loop
+        results = await run_in_threadpool(DownloadService.delete_models, entries)
         return results[0] if is_single else results
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
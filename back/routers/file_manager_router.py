@@ -10,6 +10,7 @@ This module contains all API routes for file management including:
 
 import os
 from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
 from typing import List, Optional, Dict, Any
 
@@ -21,12 +22,13 @@ from ..models.file_models import (
     ModelsInfoResponse, FileOperationResponse
 )
 from ..utils.logger import get_logger
+from ..utils.json_utils import FastJSONResponse
 
 # Initialize logger
 logger = get_logger(__name__)
 
 # Create router
-router = APIRouter(prefix="/api/file", tags=["file-manager"])
+router = APIRouter(prefix="/api/file", tags=["file-manager"], default_response_class=FastJSONResponse)
 
 # Initialize service
 file_service = FileManagerService()
@@ -68,13 +70,17 @@ def list_directories(path: str = Query("", description="Directory path to list")
 
 
 @router.get("/list_all_dirs")
-def list_all_directories(user=Depends(protected)):
+async def list_all_directories(
+    max_depth: Optional[int] = Query(None, ge=1, description="Number of directory levels to scan (all when omitted)"),
+    user=Depends(protected)
+):
     """
     GET /api/file/list_all_dirs
     
     Recursively lists all directories in the base directory.
     
     Arguments:
+    - max_depth (int, optional): Levels to scan; deeper directories get children=null (query parameter)
     - user: Authentication token (automatic via Depends)
     
     Returns:
@@ -88,7 +94,7 @@ def list_all_directories(user=Depends(protected)):
     Usage: Get complete directory tree for navigation.
     """
     try:
-        directories = file_service.list_all_directories()
+        directories = await run_in_threadpool(file_service.list_all_directories, max_depth)
         return directories
     except Exception as e:
         logger.error(f"Error listing all directories: {e}")
@@ -96,7 +102,7 @@ def list_all_directories(user=Depends(protected)):
 
 
 @router.get("/list_files")
-def list_files(
+async def list_files(
     path: str = Query("", description="Directory path to list"),
     extensions: Optional[str] = Query(None, description="Comma-separated file extensions to filter"),
     user=Depends(protected)
@@ -128,7 +134,8 @@ def list_files(
         if extensions:
             ext_list = [ext.strip() for ext in extensions.split(",")]
         
-        result = file_service.list_files(path, ext_list)
+        # Directory scans block on stat calls; keep them off the event loop
+        result = await run_in_threadpool(file_service.list_files, path, ext_list)
         return result
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Directory not found: {path}")
@@ -8,8 +8,8 @@ This module contains all API routes for JSON model management including:
 - Path normalization
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict, List, Any
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from typing import Dict, List, Any, Optional
 
 from ..services.auth_middleware import protected
 from ..services.json_models_service import JsonModelsService
@@ -21,19 +21,41 @@ from ..models.model_models import (
     ModelEntry, ModelEntryRequest, ModelGroupRequest, 
     UpdateModelGroupRequest
 )
+from ..utils.json_utils import FastJSONResponse
 from ..utils.logger import get_logger
 
 # Initialize logger
 logger = get_logger(__name__)
 
 # Create router
-router = APIRouter(prefix="/api/jsonmodels", tags=["json-models"])
+router = APIRouter(prefix="/api/jsonmodels", tags=["json-models"], default_response_class=FastJSONResponse)
 
 # Initialize service
 json_models_service = JsonModelsService()
 
 
-@router.get("/", response_model=ModelsDataResponse)
+def _not_modified(request: Request, response: Response) -> Optional[Response]:
+    """
+    Handle a conditional GET for data derived only from models.json.
+    
+    Sets the ETag header on the response and returns a 304 response when the client's
+    If-None-Match already matches it, otherwise None.
+    """
+    etag = json_models_service.get_models_etag()
+    if etag is None:
+        return None
+    
+    response.headers["ETag"] = etag
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
+# GET responses are built from server-side data that is normalized when written, so they
+# are wrapped without re-validation (model_construct) and response_model=None skips
+# FastAPI's output check.
+@router.get("/", response_model=None)
 def get_models_data(user=Depends(protected)):
     """
     GET /api/jsonmodels/
@@ -55,7 +77,7 @@ def get_models_data(user=Depends(protected)):
     """
     try:
         data = json_models_service.get_models_data_with_existence()
-        return ModelsDataResponse(
+        return ModelsDataResponse.model_construct(
             config=data.get("config", {}),
             groups=data.get("groups", {}),
             bundles=data.get("bundles")
@@ -65,7 +87,7 @@ def get_models_data(user=Depends(protected)):
         raise HTTPException(status_code=500, detail=f"Error retrieving models data: {str(e)}")
 
 
-@router.get("/config", response_model=ConfigResponse)
+@router.get("/config", response_model=None)
 def get_config(user=Depends(protected)):
     """
     GET /api/jsonmodels/config
@@ -87,7 +109,7 @@ def get_config(user=Depends(protected)):
     """
     try:
         config_info = json_models_service.get_config_info()
-        return ConfigResponse(**config_info)
+        return ConfigResponse.model_construct(**config_info)
     except Exception as e:
         logger.error(f"Error getting config: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving config: {str(e)}")
@@ -123,8 +145,8 @@ def update_config(config: ConfigUpdateRequest, user=Depends(protected)):
         raise HTTPException(status_code=500, detail=f"Error updating config: {str(e)}")
 
 
-@router.get("/groups", response_model=List[str])
-def get_groups(user=Depends(protected)):
+@router.get("/groups", response_model=None)
+def get_groups(request: Request, response: Response, user=Depends(protected)):
     """
     GET /api/jsonmodels/groups
     
@@ -136,6 +158,7 @@ def get_groups(user=Depends(protected)):
     Returns:
     - Status: 200 OK
     - Body: Array of group names in current order
+    - Status: 304 Not Modified when If-None-Match matches the models.json ETag
     
     Possible errors:
     - 401: Not authenticated
@@ -144,6 +167,9 @@ def get_groups(user=Depends(protected)):
     Usage: Get all available model group names in their display order.
     """
     try:
+        not_modified = _not_modified(request, response)
+        if not_modified:
+            return not_modified
         groups = json_models_service.get_groups_list()
         return groups
     except Exception as e:
@@ -254,8 +280,8 @@ def delete_group(group_request: ModelGroupRequest, user=Depends(protected)):
         raise HTTPException(status_code=500, detail=f"Error deleting group: {str(e)}")
 
 
-@router.get("/group/{group_name}", response_model=List[ModelEntry])
-def get_group_models(group_name: str, user=Depends(protected)):
+@router.get("/group/{group_name}", response_model=None)
+def get_group_models(group_name: str, request: Request, response: Response, user=Depends(protected)):
     """
     GET /api/jsonmodels/group/{group_name}
     
@@ -268,6 +294,7 @@ def get_group_models(group_name: str, user=Depends(protected)):
     Returns:
     - Status: 200 OK
     - Body: Array of ModelEntry objects
+    - Status: 304 Not Modified when If-None-Match matches the models.json ETag
     
     Possible errors:
     - 401: Not authenticated
@@ -277,8 +304,12 @@ def get_group_models(group_name: str, user=Depends(protected)):
     Usage: Get all models in a specific group for display or processing.
     """
     try:
+        not_modified = _not_modified(request, response)
+        # Look the group up first so a missing group is a 404 even for a matching ETag
         models = json_models_service.get_group_models(group_name)
-        return models
+        if not_modified:
+            return not_modified
+        return [ModelEntry.model_construct(**entry) for entry in models]
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -310,7 +341,7 @@ def add_model_entry(entry_request: ModelEntryRequest, user=Depends(protected)):
     Usage: Add a new model to a group with automatic path normalization.
     """
     try:
-        entry_dict = entry_request.entry.dict(exclude_none=True)
+        entry_dict = entry_request.entry.model_dump(exclude_none=True)
         result = json_models_service.add_model_entry(entry_request.group, entry_dict)
         return result
     except ValueError as e:
@@ -344,7 +375,7 @@ def update_model_entry(entry_request: ModelEntryRequest, user=Depends(protected)
     Usage: Update an existing model's properties or add a new one if not found.
     """
     try:
-        entry_dict = entry_request.entry.dict(exclude_none=True)
+        entry_dict = entry_request.entry.model_dump(exclude_none=True)
         result = json_models_service.update_model_entry(entry_request.group, entry_dict)
         return result
     except ValueError as e:
@@ -354,6 +385,38 @@ def update_model_entry(entry_request: ModelEntryRequest, user=Depends(protected)
         raise HTTPException(status_code=500, detail=f"Error updating model entry: {str(e)}")
 
 
+@router.post("/entries/bulk")
+def update_model_entries(entry_requests: List[ModelEntryRequest], user=Depends(protected)):
+    """
+    POST /api/jsonmodels/entries/bulk
+    
+    Updates or adds several model entries with a single write of models.json.
+    
+    Arguments:
+    - entry_requests (List[ModelEntryRequest]): Model entry update requests
+    - user: Authentication token (automatic via Depends)
+    
+    Returns:
+    - Status: 200 OK
+    - Body: Success response with one result per entry (updated, added or rejected)
+    
+    Possible errors:
+    - 401: Not authenticated
+    - 500: Error writing to models.json file
+    
+    Usage: Bulk import of models; each entry behaves like PUT /api/jsonmodels/entry.
+    """
+    try:
+        entries = [
+            (entry_request.group, entry_request.entry.model_dump(exclude_none=True))
+            for entry_request in entry_requests
+        ]
+        return json_models_service.update_model_entries(entries)
+    except Exception as e:
+        logger.error(f"Error updating model entries: {e}")
+        raise HTTPException(status_code=500, detail=f"Error updating model entries: {str(e)}")
+
+
 @router.delete("/entry")
 def delete_model_entry(entry_request: ModelEntryRequest, user=Depends(protected)):
     """
@@ -378,7 +441,7 @@ def delete_model_entry(entry_request: ModelEntryRequest, user=Depends(protected)
     Usage: Remove a model entry from the configuration.
     """
     try:
-        entry_dict = entry_request.entry.dict(exclude_none=True)
+        entry_dict = entry_request.entry.model_dump(exclude_none=True)
         result = json_models_service.delete_model_entry(entry_request.group, entry_dict)
         return result
     except ValueError as e:
@@ -389,8 +452,8 @@ def delete_model_entry(entry_request: ModelEntryRequest, user=Depends(protected)
         raise HTTPException(status_code=500, detail=f"Error deleting model entry: {str(e)}")
 
 
-@router.get("/group-order", response_model=GroupOrderResponse)
-def get_group_order(user=Depends(protected)):
+@router.get("/group-order", response_model=None)
+def get_group_order(request: Request, response: Response, user=Depends(protected)):
     """
     GET /api/jsonmodels/group-order
     
@@ -402,6 +465,7 @@ def get_group_order(user=Depends(protected)):
     Returns:
     - Status: 200 OK
     - Body: GroupOrderResponse with ordered group names
+    - Status: 304 Not Modified when If-None-Match matches the models.json ETag
     
     Possible errors:
     - 401: Not authenticated
@@ -410,8 +474,11 @@ def get_group_order(user=Depends(protected)):
     Usage: Get the current display order of model groups.
     """
     try:
+        not_modified = _not_modified(request, response)
+        if not_modified:
+            return not_modified
         order = json_models_service.get_group_order()
-        return GroupOrderResponse(order=order)
+        return GroupOrderResponse.model_construct(order=order)
     except Exception as e:
         logger.error(f"Error getting group order: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving group order: {str(e)}")
@@ -21,7 +21,7 @@ def add_model_entry(entry_request: ModelEntryRequest, user=Depends(protected)):
     try:
         ModelManagementService.add_model_entry(
             entry_request.group, 
-            entry_request.entry.dict(exclude_none=True)
+            entry_request.entry.model_dump(exclude_none=True)
         )
         return {"ok": True, "message": "Model entry added successfully"}
     except ValueError as e:
@@ -45,7 +45,7 @@ def update_model_entry(entry_request: ModelEntryRequest, user=Depends(protected)
     try:
         was_updated = ModelManagementService.update_model_entry(
             entry_request.group, 
-            entry_request.entry.dict(exclude_none=True)
+            entry_request.entry.model_dump(exclude_none=True)
         )
         message = "Model entry updated" if was_updated else "Model entry added"
         return {"ok": True, "message": message}
@@ -67,7 +67,7 @@ def delete_model_entry(entry_request: ModelEntryRequest, user=Depends(protected)
     try:
         ModelManagementService.delete_model_entry(
             entry_request.group, 
-            entry_request.entry.dict(exclude_none=True)
+            entry_request.entry.model_dump(exclude_none=True)
         )
         return {"ok": True, "message": "Model entry deleted successfully"}
     except ValueError as e:
@@ -89,7 +89,7 @@ def delete_model_file(delete_request: DeleteModelRequest, user=Depends(protected
     **Returns:** Dict with success status and message
     """
     try:
-        ModelManagementService.delete_model_file(delete_request.entry.dict(exclude_none=True))
+        ModelManagementService.delete_model_file(delete_request.entry.model_dump(exclude_none=True))
         return {"ok": True, "message": "Model file deleted successfully"}
     except ValueError as e:
         if "does not exist" in str(e):
@@ -86,7 +86,7 @@ def delete_group(group_request: ModelGroupRequest, user=Depends(protected)):
             raise HTTPException(status_code=400, detail=str(e))
 
 
-@model_groups_router.get("/{group_name}", response_model=List[ModelEntry])
+@model_groups_router.get("/{group_name}", response_model=None)
 def get_group_models(group_name: str, user=Depends(protected)):
     """
     Retrieves all model entries for a specific group.
@@ -98,6 +98,8 @@ def get_group_models(group_name: str, user=Depends(protected)):
     **Returns:** List of model entries
     """
     try:
-        return ModelManagementService.get_group_models(group_name)
+        # Entries come from models.json, which is normalized on write: wrap without re-validating
+        models = ModelManagementService.get_group_models(group_name)
+        return [ModelEntry.model_construct(**entry) for entry in models]
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
 from back.services.model_service import ModelService
 from back.services.model_management_service import ModelManagementService
 from back.services.token_service import TokenService
@@ -33,7 +34,8 @@ async def get_version_endpoint():
     **Parameters:** None
     **Returns:** Dict containing version information
     """
-    return get_version_info()
+    # get_version_info reads version.json from disk
+    return await run_in_threadpool(get_version_info)
 
 
 @model_router.get("/total_size")
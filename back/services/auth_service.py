@@ -3,10 +3,15 @@ import json
 import jwt
 import hashlib
 import base64
+import hmac
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from fastapi import HTTPException
 from ..utils.logger import get_logger
+from ..utils.json_utils import load_json_file
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -16,6 +21,14 @@ JWT_SECRET = "change_this_secret"
 JWT_ALGO = "HS256"
 JWT_EXP_MINUTES = 60*8
 USERS_JSON = "users.json"
+JWT_CACHE_TTL = 30  # Seconds a decoded token is trusted without re-verification
+JWT_CACHE_MAXSIZE = 10000
+
+
+@lru_cache(maxsize=8)
+def _users_file_path(base_dir: str) -> str:
+    # Keyed on the COMFYUI_MODEL_DIR value so runtime changes still take effect
+    return os.path.join(base_dir, USERS_JSON)
 
 
 class AuthService:
@@ -34,6 +47,14 @@ class AuthService:
     model operations (use appropriate model services).
     """
     
+    # Cache of decoded tokens: sha256(token)[:32] -> (username, expires_at)
+    _jwt_cache: Dict[str, Tuple[str, float]] = {}
+    _jwt_cache_lock = threading.Lock()
+    
+    # Parsed users.json, reloaded only when the file's st_mtime_ns changes
+    _users_cache = {"mtime": None, "data": None}
+    _users_cache_lock = threading.Lock()
+    
     @staticmethod
     def hash_password(password: str) -> str:
         """
@@ -54,13 +75,13 @@ class AuthService:
         """
         Verify a password against its hash.
         
-        **Description:** Verifies a plain text password against its stored hash.
+        **Description:** Verifies a plain text password against its stored hash in constant time.
         **Parameters:**
         - `password` (str): The plain text password to verify
         - `hashed` (str): The stored hash to compare against
         **Returns:** bool indicating if the password is correct
         """
-        return AuthService.hash_password(password) == hashed
+        return hmac.compare_digest(AuthService.hash_password(password).encode(), hashed.encode())
 
     @staticmethod
     def is_password_hashed(password: str) -> bool:
@@ -88,8 +109,7 @@ class AuthService:
         **Parameters:** None
         **Returns:** str containing the path to users.json
         """
-        base_dir = os.environ.get("COMFYUI_MODEL_DIR", ".")
-        return os.path.join(base_dir, USERS_JSON)
+        return _users_file_path(os.environ.get("COMFYUI_MODEL_DIR", "."))
 
     @staticmethod
     def load_users() -> Dict[str, str]:
@@ -97,6 +117,7 @@ class AuthService:
         Load users from the users.json file with automatic migration from plain text passwords.
         
         **Description:** Loads user data and migrates plain text passwords to hashed passwords.
+        The parsed file is cached until its modification time changes.
         **Parameters:** None
         **Returns:** Dict containing username to password hash mappings
         """
@@ -104,13 +125,17 @@ class AuthService:
         if not os.path.exists(users_path):
             # Create a default user if the file doesn't exist
             os.makedirs(os.path.dirname(users_path), exist_ok=True)
-            with open(users_path, "w", encoding="utf-8") as f:
-                # Store hashed password for default user
-                hashed_password = AuthService.hash_password("admin")
-                json.dump({"admin": hashed_password}, f)
+            # Store hashed password for default user
+            hashed_password = AuthService.hash_password("admin")
+            AuthService.save_users({"admin": hashed_password})
+        
+        mtime = os.stat(users_path).st_mtime_ns
+        with AuthService._users_cache_lock:
+            if AuthService._users_cache["mtime"] == mtime:
+                # Callers may mutate the result, hand out a copy
+                return dict(AuthService._users_cache["data"])
         
-        with open(users_path, "r", encoding="utf-8") as f:
-            users = json.load(f)
+        users = load_json_file(users_path)
         
         # Migrate plain text passwords to hashed passwords
         updated = False
@@ -121,11 +146,31 @@ class AuthService:
         
         # Save updated users if migration occurred
         if updated:
-            with open(users_path, "w", encoding="utf-8") as f:
-                json.dump(users, f)
+            AuthService.save_users(users)
+        else:
+            with AuthService._users_cache_lock:
+                AuthService._users_cache["mtime"] = mtime
+                AuthService._users_cache["data"] = dict(users)
         
         return users
 
+    @staticmethod
+    def save_users(users: Dict[str, str]) -> None:
+        """
+        Save users to the users.json file and refresh the users cache.
+        
+        **Description:** Persists username to password hash mappings.
+        **Parameters:**
+        - `users` (Dict[str, str]): Username to password hash mappings
+        **Returns:** None
+        """
+        users_path = AuthService.get_users_file_path()
+        with AuthService._users_cache_lock:
+            with open(users_path, "w", encoding="utf-8") as f:
+                json.dump(users, f)
+            AuthService._users_cache["mtime"] = os.stat(users_path).st_mtime_ns
+            AuthService._users_cache["data"] = dict(users)
+
     @staticmethod
     def verify_user(username: str, password: str) -> bool:
         """
@@ -147,7 +192,7 @@ class AuthService:
             return AuthService.verify_password(password, stored_password)
         else:
             # Fallback for plain text (shouldn't happen after migration)
-            return stored_password == password
+            return hmac.compare_digest(stored_password.encode(), password.encode())
 
     @staticmethod
     def create_jwt(username: str) -> str:
@@ -171,15 +216,38 @@ class AuthService:
         Decode and verify a JWT token.
         
         **Description:** Decodes a JWT token and returns the username if valid.
+        Verified tokens are cached for up to JWT_CACHE_TTL seconds (never past their expiration).
         **Parameters:**
         - `token` (str): The JWT token to decode
         **Returns:** str containing the username, or None if invalid
         """
+        key = hashlib.sha256(token.encode('utf-8')).hexdigest()[:32]
+        now = time.time()
+        with AuthService._jwt_cache_lock:
+            cached = AuthService._jwt_cache.get(key)
+        if cached and cached[1] > now:
+            return cached[0]
+        
         try:
             payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGO])
-            return payload["sub"]
+            username = payload["sub"]
         except Exception:
             return None
+        
+        # Never keep a token in cache past its own expiration
+        expires_at = now + JWT_CACHE_TTL
+        if payload.get("exp") is not None:
+            expires_at = min(expires_at, float(payload["exp"]))
+        
+        with AuthService._jwt_cache_lock:
+            if len(AuthService._jwt_cache) >= JWT_CACHE_MAXSIZE:
+                AuthService._jwt_cache = {
+                    k: v for k, v in AuthService._jwt_cache.items() if v[1] > now
+                }
+                if len(AuthService._jwt_cache) >= JWT_CACHE_MAXSIZE:
+                    AuthService._jwt_cache.clear()
+            AuthService._jwt_cache[key] = (username, expires_at)
+        return username
 
     @staticmethod
     def change_user_credentials(old_username: str, old_password: str, 
@@ -208,8 +276,6 @@ class AuthService:
         # Update the users.json file with hashed password
         del users[old_username]
         users[new_username] = AuthService.hash_password(new_password)
-        users_path = AuthService.get_users_file_path()
-        with open(users_path, "w", encoding="utf-8") as f:
-            json.dump(users, f)
+        AuthService.save_users(users)
         
         return True
@@ -3,12 +3,15 @@ import json
 import uuid
 import zipfile
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from .download_manager import DownloadManager
 from .config_service import ConfigService
 from ..models.bundle_models import Bundle, BundleCreate, BundleUpdate
 from ..utils.logger import get_logger
+from ..utils.json_utils import dumps_json, load_json_file, loads_json
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -16,6 +19,9 @@ logger = get_logger(__name__)
 # Constants
 BUNDLES_DIR = "bundles"
 INSTALLED_BUNDLES_FILE = "installed_bundles.json"
+BUNDLES_INDEX_FILE = ".bundles_index.json"
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+ZIP_COPY_CHUNK_SIZE = 256 * 1024
 WORKFLOW_DIR = "workflows"
 
 
@@ -35,6 +41,16 @@ class BundleService:
     specialized services (ModelManager for model ops, DownloadManager for downloads).
     """
     
+    # bundle zip path -> (st_mtime_ns, st_size, parsed bundle definition)
+    _bundle_cache: Dict[str, tuple] = {}
+    # Bundles directories whose on-disk index has been merged into _bundle_cache
+    _index_loaded: set = set()
+    _index_dirty = False
+    # Parsed installed_bundles.json keyed on (path, st_mtime_ns)
+    _installed_cache = {"key": None, "data": None}
+    # Upper bound on threads used to read uncached bundle ZIPs in get_all_bundles
+    LIST_MAX_WORKERS = min(16, (os.cpu_count() or 4) * 2)
+    
     @staticmethod
     def get_bundles_directory() -> str:
         """
@@ -84,17 +100,35 @@ class BundleService:
         if not os.path.exists(bundles_dir):
             return bundles
         
-        for filename in os.listdir(bundles_dir):
-            if filename.endswith(".zip"):
-                bundle_path = os.path.join(bundles_dir, filename)
+        self._load_index(bundles_dir)
+        zip_entries = self._scan_bundle_zips(bundles_dir)
+        bundle_paths = [path for path, _ in zip_entries]
+        bundle_stats = [st for _, st in zip_entries]
+        seen = set(bundle_paths)
+        
+        # ZIPs missing from the cache have to be opened and inflated; read them concurrently
+        uncached = sum(1 for path in bundle_paths if path not in BundleService._bundle_cache)
+        if uncached > 1:
+            with ThreadPoolExecutor(max_workers=min(self.LIST_MAX_WORKERS, uncached)) as executor:
+                results = list(executor.map(self._safe_load_bundle_data, bundle_paths, bundle_stats))
+        else:
+            results = [self._safe_load_bundle_data(path, st) for path, st in zip_entries]
+        
+        for bundle_path, bundle_data in zip(bundle_paths, results):
+            if bundle_data:
                 try:
-                    bundle_data = self._read_bundle_from_zip(bundle_path)
-                    if bundle_data:
-                        # Convert dict to Bundle object
-                        bundle = Bundle(**bundle_data)
-                        bundles.append(bundle)
+                    # Convert dict to Bundle object
+                    bundles.append(Bundle(**bundle_data))
                 except Exception as e:
-                    logger.error(f"Error loading bundle {filename}: {e}")
+                    logger.error(f"Error loading bundle {os.path.basename(bundle_path)}: {e}")
+        
+        # Forget ZIPs removed from disk, then persist the index if anything changed
+        for bundle_path in list(BundleService._bundle_cache):
+            if os.path.dirname(bundle_path) == bundles_dir and bundle_path not in seen:
+                del BundleService._bundle_cache[bundle_path]
+                BundleService._index_dirty = True
+        if BundleService._index_dirty:
+            self._write_index(bundles_dir)
         
         return bundles
     
@@ -108,22 +142,39 @@ class BundleService:
         **Returns:** Bundle object
         **Raises:** FileNotFoundError if bundle not found
         """
+        bundle_data = self._find_bundle_data(bundle_id)
+        try:
+            return Bundle(**bundle_data)
+        except Exception as e:
+            logger.error(f"Invalid bundle definition for {bundle_id}: {e}")
+            raise FileNotFoundError(f"Bundle {bundle_id} not found")
+    
+    def _find_bundle_data(self, bundle_id: str) -> Dict[str, Any]:
+        """
+        Find the stored definition of a bundle without validating it.
+        
+        **Description:** Searches the bundle ZIPs for a matching ID and returns the raw
+        definition dict. The dict is shared with the bundle cache and must not be mutated.
+        **Parameters:**
+        - `bundle_id` (str): Bundle identifier
+        **Returns:** Dictionary containing bundle data
+        **Raises:** FileNotFoundError if bundle not found
+        """
         bundles_dir = self.get_bundles_directory()
         
         if not os.path.exists(bundles_dir):
             raise FileNotFoundError(f"Bundle {bundle_id} not found")
         
+        self._load_index(bundles_dir)
         # Search through all ZIP files to find the bundle with matching ID
-        for filename in os.listdir(bundles_dir):
-            if filename.endswith(".zip"):
-                bundle_path = os.path.join(bundles_dir, filename)
-                try:
-                    bundle_data = self._read_bundle_from_zip(bundle_path)
-                    if bundle_data and bundle_data.get("id") == bundle_id:
-                        return Bundle(**bundle_data)
-                except Exception as e:
-                    logger.error(f"Error reading bundle from {filename}: {e}")
-                    continue
+        for bundle_path, st in self._scan_bundle_zips(bundles_dir):
+            try:
+                bundle_data = self._load_bundle_data(bundle_path, st)
+                if bundle_data and bundle_data.get("id") == bundle_id:
+                    return bundle_data
+            except Exception as e:
+                logger.error(f"Error reading bundle from {os.path.basename(bundle_path)}: {e}")
+                continue
         
         raise FileNotFoundError(f"Bundle {bundle_id} not found")
     
@@ -153,7 +204,7 @@ class BundleService:
             "author": bundle_data.author,
             "website": bundle_data.website,
             "workflows": bundle_data.workflows,
-            "hardware_profiles": {k: v.dict() for k, v in bundle_data.hardware_profiles.items()},
+            "hardware_profiles": {k: v.model_dump() for k, v in bundle_data.hardware_profiles.items()},
             "workflow_params": bundle_data.workflow_params,
             "created_at": now,
             "updated_at": now
@@ -167,9 +218,9 @@ class BundleService:
         workflows_dir = self.get_workflows_directory()
         
         with zipfile.ZipFile(bundle_zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Add bundle definition JSON
-            bundle_json = json.dumps(bundle_dict, indent=2)
-            zipf.writestr(f"{bundle_id}.json", bundle_json)
+            # Add bundle definition JSON, stored uncompressed so reading it needs no inflate
+            bundle_json = dumps_json(bundle_dict, indent=True)
+            zipf.writestr(f"{bundle_id}.json", bundle_json, compress_type=zipfile.ZIP_STORED)
             
             # Add workflows if they exist
             for workflow_file in bundle_data.workflows:
@@ -179,6 +230,7 @@ class BundleService:
                 else:
                     logger.warning(f"Workflow file {workflow_file} not found in {workflows_dir}")
         
+        self._remember_bundle(bundle_zip_path, bundle_dict)
         return Bundle(**bundle_dict)
     
     def update_bundle(self, bundle_id: str, bundle_data: BundleUpdate) -> Bundle:
@@ -192,28 +244,14 @@ class BundleService:
         **Returns:** Updated Bundle object
         **Raises:** FileNotFoundError if bundle not found
         """
-        existing_bundle = self.get_bundle(bundle_id)
-        
-        # Update fields
-        updated_dict = existing_bundle.dict()
-        if bundle_data.name is not None:
-            updated_dict["name"] = bundle_data.name
-        if bundle_data.description is not None:
-            updated_dict["description"] = bundle_data.description
-        if bundle_data.version is not None:
-            updated_dict["version"] = bundle_data.version
-        if bundle_data.author is not None:
-            updated_dict["author"] = bundle_data.author
-        if bundle_data.website is not None:
-            updated_dict["website"] = bundle_data.website
-        if bundle_data.workflows is not None:
-            updated_dict["workflows"] = bundle_data.workflows
-        if bundle_data.hardware_profiles is not None:
-            updated_dict["hardware_profiles"] = {k: v.dict() for k, v in bundle_data.hardware_profiles.items()}
-        if bundle_data.workflow_params is not None:
-            updated_dict["workflow_params"] = bundle_data.workflow_params
-        
-        updated_dict["updated_at"] = datetime.now().isoformat()
+        existing_data = self._find_bundle_data(bundle_id)
+        
+        # Update fields (fields left as None keep their current value), then validate the result once
+        merged = dict(existing_data)
+        merged.update(bundle_data.model_dump(exclude_none=True))
+        merged["updated_at"] = datetime.now().isoformat()
+        updated_bundle = Bundle(**merged)
+        updated_dict = updated_bundle.model_dump()
         
         bundles_dir = self.get_bundles_directory()
         bundle_zip_path = os.path.join(bundles_dir, f"{bundle_id}.zip")
@@ -224,11 +262,11 @@ class BundleService:
         
         with zipfile.ZipFile(temp_zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
             # Add updated bundle definition JSON
-            bundle_json = json.dumps(updated_dict, indent=2)
-            zipf.writestr(f"{bundle_id}.json", bundle_json)
+            bundle_json = dumps_json(updated_dict, indent=True)
+            zipf.writestr(f"{bundle_id}.json", bundle_json, compress_type=zipfile.ZIP_STORED)
             
             # Add workflows (use updated list if provided, otherwise keep existing)
-            workflows_to_add = bundle_data.workflows if bundle_data.workflows is not None else existing_bundle.workflows
+            workflows_to_add = updated_bundle.workflows
             for workflow_file in workflows_to_add:
                 workflow_path = os.path.join(workflows_dir, workflow_file)
                 if os.path.exists(workflow_path):
@@ -237,11 +275,10 @@ class BundleService:
                     logger.warning(f"Workflow file {workflow_file} not found in {workflows_dir}")
         
         # Replace original with updated ZIP
-        if os.path.exists(bundle_zip_path):
-            os.remove(bundle_zip_path)
-        os.rename(temp_zip_path, bundle_zip_path)
+        os.replace(temp_zip_path, bundle_zip_path)
+        self._remember_bundle(bundle_zip_path, updated_dict)
         
-        return Bundle(**updated_dict)
+        return updated_bundle
     
     def delete_bundle(self, bundle_id: str) -> None:
         """
@@ -260,6 +297,8 @@ class BundleService:
             raise FileNotFoundError(f"Bundle {bundle_id} not found")
         
         os.remove(bundle_path)
+        if BundleService._bundle_cache.pop(bundle_path, None):
+            BundleService._index_dirty = True
         logger.info(f"Bundle {bundle_id} deleted successfully")
 
     def import_bundle_from_zip(self, upload_file) -> str:
@@ -275,42 +314,44 @@ class BundleService:
         if not upload_file.filename.endswith('.zip'):
             raise ValueError("File must be a ZIP archive")
         
-        # Save uploaded file temporarily to read bundle data
-        temp_path = f"/tmp/{upload_file.filename}"
+        # Read bundle data straight from the uploaded (seekable) file to get bundle ID and validate
+        bundle_data = self._read_bundle_from_zip(upload_file.file)
+        if not bundle_data:
+            raise ValueError("Invalid bundle ZIP file - no bundle definition found")
+        
+        bundle_id = bundle_data.get("id")
+        if not bundle_id:
+            raise ValueError("Bundle definition missing required 'id' field")
+        
+        # Check if bundle already exists
         try:
-            with open(temp_path, "wb") as buffer:
-                shutil.copyfileobj(upload_file.file, buffer)
-            
-            # Read bundle data from ZIP to get bundle ID and validate
-            bundle_data = self._read_bundle_from_zip(temp_path)
-            if not bundle_data:
-                raise ValueError("Invalid bundle ZIP file - no bundle definition found")
-            
-            bundle_id = bundle_data.get("id")
-            if not bundle_id:
-                raise ValueError("Bundle definition missing required 'id' field")
-            
-            # Check if bundle already exists
-            try:
-                existing_bundle = self.get_bundle(bundle_id)
-                raise ValueError(f"Bundle with ID '{bundle_id}' already exists")
-            except FileNotFoundError:
-                # Bundle doesn't exist, we can proceed
-                pass
-            
-            # Copy ZIP file to bundles directory
-            bundles_dir = self.get_bundles_directory()
-            os.makedirs(bundles_dir, exist_ok=True)
+            existing_bundle = self.get_bundle(bundle_id)
+            raise ValueError(f"Bundle with ID '{bundle_id}' already exists")
+        except FileNotFoundError:
+            # Bundle doesn't exist, we can proceed
+            pass
+        
+        bundles_dir = self.get_bundles_directory()
+        os.makedirs(bundles_dir, exist_ok=True)
+        
+        # Stream the upload next to its final location so it can be moved into place without a copy
+        upload_file.file.seek(0)
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(dir=bundles_dir, suffix=".upload", delete=False) as buffer:
+                temp_path = buffer.name
+                shutil.copyfileobj(upload_file.file, buffer, UPLOAD_CHUNK_SIZE)
             
+            # Move ZIP file into the bundles directory
             bundle_zip_path = os.path.join(bundles_dir, f"{bundle_id}.zip")
-            shutil.copy2(temp_path, bundle_zip_path)
+            os.replace(temp_path, bundle_zip_path)
             
             logger.info(f"Bundle {bundle_id} imported successfully")
             return bundle_id
             
         finally:
-            # Clean up temp file
-            if os.path.exists(temp_path):
+            # Clean up temp file (left behind if the copy or the move failed)
+            if temp_path and os.path.exists(temp_path):
                 os.remove(temp_path)
 
     def get_bundle_download_path(self, bundle_id: str) -> str:
@@ -357,13 +398,14 @@ class BundleService:
         new_bundle_id = str(uuid.uuid4())
         now = datetime.now().isoformat()
         
-        new_bundle_dict = source_bundle.dict()
-        new_bundle_dict.update({
+        # model_dump() returns fresh nested containers, so the copy shares nothing with the source
+        new_bundle_dict = {
+            **source_bundle.model_dump(),
             "id": new_bundle_id,
             "name": new_name,
             "created_at": now,
             "updated_at": now
-        })
+        }
         
         # Copy ZIP file with new content
         bundles_dir = self.get_bundles_directory()
@@ -375,12 +417,12 @@ class BundleService:
                 # Copy workflows
                 for item in source_zip.infolist():
                     if item.filename.startswith('workflows/'):
-                        data = source_zip.read(item.filename)
-                        new_zip.writestr(item.filename, data)
+                        BundleService._copy_zip_entry(source_zip, new_zip, item)
                 
                 # Add updated bundle definition
-                bundle_json = json.dumps(new_bundle_dict, indent=2)
-                new_zip.writestr(f"{new_bundle_id}.json", bundle_json)
+                bundle_json = dumps_json(new_bundle_dict, indent=True)
+                new_zip.writestr(f"{new_bundle_id}.json", bundle_json, compress_type=zipfile.ZIP_STORED)
+        self._remember_bundle(new_zip_path, new_bundle_dict)
         
         return new_bundle_id
 
@@ -438,21 +480,13 @@ class BundleService:
         **Returns:** None
         **Raises:** FileNotFoundError if bundle not installed
         """
-        installed_file = self.get_installed_bundles_file()
-        
-        if not os.path.exists(installed_file):
-            raise FileNotFoundError(f"Bundle {bundle_id} is not installed")
-        
-        with open(installed_file, "r", encoding="utf-8") as f:
-            installed_bundles = json.load(f)
+        installed_bundles = self._load_installed_bundles()
         
         if bundle_id not in installed_bundles:
             raise FileNotFoundError(f"Bundle {bundle_id} is not installed")
         
         del installed_bundles[bundle_id]
-        
-        with open(installed_file, "w", encoding="utf-8") as f:
-            json.dump(installed_bundles, f, indent=2)
+        self._save_installed_bundles(installed_bundles)
 
     def get_installed_bundles(self) -> List[Dict[str, Any]]:
         """
@@ -462,26 +496,27 @@ class BundleService:
         **Parameters:** None
         **Returns:** List of installed bundle information
         """
-        installed_file = self.get_installed_bundles_file()
-        
-        if not os.path.exists(installed_file):
-            return []
-        
         try:
-            with open(installed_file, "r", encoding="utf-8") as f:
-                installed_bundles = json.load(f)
+            installed_bundles = self._load_installed_bundles()
+            if not installed_bundles:
+                return []
+            
+            # One listing instead of a full bundles directory scan per installed bundle
+            bundles_by_id = {}
+            for bundle in self.get_all_bundles():
+                bundles_by_id.setdefault(bundle.id, bundle)
             
             result = []
             for bundle_id, info in installed_bundles.items():
-                try:
-                    bundle_data = self.get_bundle(bundle_id)
-                    result.append({
-                        "bundle": bundle_data,
-                        "installation": info
-                    })
-                except FileNotFoundError:
+                bundle_data = bundles_by_id.get(bundle_id)
+                if bundle_data is None:
                     # Bundle file was deleted but still tracked as installed
                     logger.warning(f"Installed bundle {bundle_id} not found in bundles directory")
+                    continue
+                result.append({
+                    "bundle": bundle_data,
+                    "installation": info
+                })
             
             return result
         except Exception as e:
@@ -514,8 +549,7 @@ class BundleService:
                 with zipfile.ZipFile(export_path, 'w', zipfile.ZIP_DEFLATED) as export_zip:
                     # Copy all content from source bundle
                     for item in source_zip.infolist():
-                        data = source_zip.read(item.filename)
-                        export_zip.writestr(item.filename, data)
+                        BundleService._copy_zip_entry(source_zip, export_zip, item)
                     
                     # Add models if requested
                     if include_models:
@@ -584,15 +618,10 @@ class BundleService:
         - `installation_status` (Dict[str, Any]): Installation result
         **Returns:** None
         """
-        installed_file = BundleService.get_installed_bundles_file()
-        
-        installed_bundles = {}
-        if os.path.exists(installed_file):
-            try:
-                with open(installed_file, "r", encoding="utf-8") as f:
-                    installed_bundles = json.load(f)
-            except Exception:
-                pass
+        try:
+            installed_bundles = BundleService._load_installed_bundles()
+        except Exception:
+            installed_bundles = {}
         
         installed_bundles[bundle_id] = {
             "profile": profile,
@@ -602,9 +631,221 @@ class BundleService:
             "failed_models": installation_status["failed_models"]
         }
         
+        BundleService._save_installed_bundles(installed_bundles)
+
+    @staticmethod
+    def _load_installed_bundles() -> Dict[str, Any]:
+        """
+        Load the installed bundles tracking data.
+        
+        **Description:** Returns the content of installed_bundles.json, re-parsing it only when
+        the file's modification time changes. Callers receive a copy they may modify.
+        **Parameters:** None
+        **Returns:** Dict mapping bundle IDs to installation information (empty if the file is missing)
+        """
+        installed_file = BundleService.get_installed_bundles_file()
+        try:
+            cache_key = (installed_file, os.stat(installed_file).st_mtime_ns)
+        except OSError:
+            return {}
+        
+        cache = BundleService._installed_cache
+        if cache["key"] != cache_key:
+            BundleService._installed_cache = {"key": cache_key, "data": load_json_file(installed_file)}
+        return dict(BundleService._installed_cache["data"])
+
+    @staticmethod
+    def _save_installed_bundles(installed_bundles: Dict[str, Any]) -> None:
+        """
+        Save the installed bundles tracking data.
+        
+        **Description:** Writes installed_bundles.json and refreshes the in-memory copy.
+        **Parameters:**
+        - `installed_bundles` (Dict[str, Any]): Bundle IDs mapped to installation information
+        **Returns:** None
+        """
+        installed_file = BundleService.get_installed_bundles_file()
         os.makedirs(os.path.dirname(installed_file), exist_ok=True)
         with open(installed_file, "w", encoding="utf-8") as f:
             json.dump(installed_bundles, f, indent=2)
+        BundleService._installed_cache = {
+            "key": (installed_file, os.stat(installed_file).st_mtime_ns),
+            "data": dict(installed_bundles)
+        }
+
+    @staticmethod
+    def _scan_bundle_zips(bundles_dir: str) -> List[Tuple[str, os.stat_result]]:
+        """
+        List the bundle ZIPs of a bundles directory with their stat results.
+        
+        **Description:** Uses os.scandir so non-ZIP entries are skipped without a stat call
+        and the stat of each ZIP can be reused as the bundle cache key.
+        **Parameters:**
+        - `bundles_dir` (str): Bundles directory
+        **Returns:** List of (zip path, stat result) tuples
+        """
+        zip_entries = []
+        with os.scandir(bundles_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".zip"):
+                    continue
+                try:
+                    if entry.is_file():
+                        zip_entries.append((entry.path, entry.stat()))
+                except OSError:
+                    continue
+        return zip_entries
+
+    @staticmethod
+    def _load_bundle_data(bundle_path: str, st: Optional[os.stat_result] = None) -> Optional[Dict[str, Any]]:
+        """
+        Read a stored bundle definition, reusing the last parse while the ZIP is unchanged.
+        
+        **Description:** Caches the result of _read_bundle_from_zip keyed on the file's
+        (st_mtime_ns, st_size), so listings do not reopen and inflate every ZIP.
+        The returned dict is shared with the cache and must not be mutated.
+        **Parameters:**
+        - `bundle_path` (str): Path to a bundle ZIP in the bundles directory
+        - `st` (os.stat_result, optional): Stat result already obtained for the ZIP
+        **Returns:** Dictionary containing bundle data or None if failed
+        """
+        if st is None:
+            try:
+                st = os.stat(bundle_path)
+            except OSError:
+                BundleService._bundle_cache.pop(bundle_path, None)
+                return None
+        
+        cached = BundleService._bundle_cache.get(bundle_path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        
+        bundle_data = BundleService._read_bundle_from_zip(bundle_path)
+        if bundle_data is not None:
+            BundleService._bundle_cache[bundle_path] = (st.st_mtime_ns, st.st_size, bundle_data)
+            BundleService._index_dirty = True
+        return bundle_data
+
+    @staticmethod
+    def _safe_load_bundle_data(bundle_path: str, st: Optional[os.stat_result] = None) -> Optional[Dict[str, Any]]:
+        """
+        Load a bundle definition for a listing, logging instead of raising.
+        
+        **Description:** Wrapper around _load_bundle_data used by get_all_bundles so one
+        unreadable ZIP does not abort the whole listing.
+        **Parameters:**
+        - `bundle_path` (str): Path to a bundle ZIP in the bundles directory
+        - `st` (os.stat_result, optional): Stat result already obtained for the ZIP
+        **Returns:** Dictionary containing bundle data or None if failed
+        """
+        try:
+            return BundleService._load_bundle_data(bundle_path, st)
+        except Exception as e:
+            logger.error(f"Error loading bundle {os.path.basename(bundle_path)}: {e}")
+            return None
+
+    @staticmethod
+    def _remember_bundle(bundle_path: str, bundle_data: Dict[str, Any]) -> None:
+        """
+        Record a bundle definition that was just written to disk.
+        
+        **Description:** Primes the bundle cache with the definition and the ZIP's new stat key,
+        so the next listing trusts it instead of reopening and re-parsing the archive.
+        **Parameters:**
+        - `bundle_path` (str): Path of the written bundle ZIP
+        - `bundle_data` (Dict[str, Any]): Definition stored in the ZIP (must not be mutated afterwards)
+        **Returns:** None
+        """
+        try:
+            st = os.stat(bundle_path)
+        except OSError:
+            return
+        BundleService._bundle_cache[bundle_path] = (st.st_mtime_ns, st.st_size, bundle_data)
+        BundleService._index_dirty = True
+
+    @staticmethod
+    def _load_index(bundles_dir: str) -> None:
+        """
+        Seed the bundle cache from the bundles directory index file.
+        
+        **Description:** Reads `.bundles_index.json` once per bundles directory so that, after a
+        restart, listing only stats the ZIPs instead of opening them. Entries still carry the
+        ZIP's mtime and size and are re-read by _load_bundle_data when those no longer match.
+        **Parameters:**
+        - `bundles_dir` (str): Bundles directory
+        **Returns:** None
+        """
+        if bundles_dir in BundleService._index_loaded:
+            return
+        BundleService._index_loaded.add(bundles_dir)
+        
+        index_path = os.path.join(bundles_dir, BUNDLES_INDEX_FILE)
+        try:
+            index = load_json_file(index_path)
+            for filename, item in index.get("bundles", {}).items():
+                bundle_path = os.path.join(bundles_dir, filename)
+                BundleService._bundle_cache.setdefault(
+                    bundle_path, (item["mtime_ns"], item["size"], item["bundle"])
+                )
+        except FileNotFoundError:
+            BundleService._index_dirty = True
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable bundle index {index_path}: {e}")
+            BundleService._index_dirty = True
+
+    @staticmethod
+    def _write_index(bundles_dir: str) -> None:
+        """
+        Persist the cached bundle definitions of a bundles directory.
+        
+        **Description:** Writes `.bundles_index.json` through a per-writer temporary file and
+        os.replace, so readers never see a partial index even when listings run concurrently.
+        **Parameters:**
+        - `bundles_dir` (str): Bundles directory
+        **Returns:** None
+        """
+        bundles = {}
+        for bundle_path, (mtime_ns, size, bundle_data) in list(BundleService._bundle_cache.items()):
+            if os.path.dirname(bundle_path) == bundles_dir:
+                bundles[os.path.basename(bundle_path)] = {
+                    "mtime_ns": mtime_ns,
+                    "size": size,
+                    "bundle": bundle_data
+                }
+        
+        index_path = os.path.join(bundles_dir, BUNDLES_INDEX_FILE)
+        temp_path = None
+        try:
+            # Concurrent listings may write the index at the same time: each gets its own temp file
+            fd, temp_path = tempfile.mkstemp(dir=bundles_dir, prefix=f"{BUNDLES_INDEX_FILE}.", suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(dumps_json({"bundles": bundles}))
+            os.replace(temp_path, index_path)
+            BundleService._index_dirty = False
+        except OSError as e:
+            logger.warning(f"Could not write bundle index {index_path}: {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    @staticmethod
+    def _copy_zip_entry(source_zip: zipfile.ZipFile, target_zip: zipfile.ZipFile, item: zipfile.ZipInfo) -> None:
+        """
+        Copy one entry between two open ZIP archives.
+        
+        **Description:** Streams the decompressed entry in ZIP_COPY_CHUNK_SIZE blocks instead of
+        materializing it in memory, keeping the entry's name, timestamp and compression method.
+        **Parameters:**
+        - `source_zip` (zipfile.ZipFile): Archive opened for reading
+        - `target_zip` (zipfile.ZipFile): Archive opened for writing
+        - `item` (zipfile.ZipInfo): Entry of `source_zip` to copy
+        **Returns:** None
+        """
+        info = zipfile.ZipInfo(item.filename, date_time=item.date_time)
+        info.compress_type = item.compress_type
+        info.external_attr = item.external_attr
+        force_zip64 = item.file_size >= zipfile.ZIP64_LIMIT
+        with source_zip.open(item) as source, target_zip.open(info, 'w', force_zip64=force_zip64) as target:
+            shutil.copyfileobj(source, target, ZIP_COPY_CHUNK_SIZE)
 
     @staticmethod
     def _read_bundle_from_zip(zip_path: str) -> Optional[Dict[str, Any]]:
@@ -613,7 +854,7 @@ class BundleService:
         
         **Description:** Extracts and returns bundle definition from a ZIP file without extracting it.
         **Parameters:**
-        - `zip_path` (str): Path to the ZIP file containing the bundle
+        - `zip_path` (str | file object): Path to, or seekable file object of, the ZIP containing the bundle
         **Returns:** Dictionary containing bundle data or None if failed
         """
         try:
@@ -625,7 +866,7 @@ class BundleService:
                     return None
                 
                 bundle_file = bundle_files[0]
-                bundle_data = json.loads(zipf.read(bundle_file).decode('utf-8'))
+                bundle_data = loads_json(zipf.read(bundle_file))
                 return bundle_data
         except Exception as e:
             logger.error(f"Error reading bundle from ZIP {zip_path}: {e}")
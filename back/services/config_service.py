@@ -1,11 +1,21 @@
 import json
 import os
+import threading
+from functools import lru_cache
 from typing import Any, Dict
 from ..utils.logger import get_logger
+from ..utils.json_utils import load_json_file
 
 # Initialize logger
 logger = get_logger(__name__)
 
+
+@lru_cache(maxsize=8)
+def _env_file_path(base_dir: str) -> str:
+    # Keyed on the resolved BASE_DIR so a changed base directory still takes effect
+    return os.path.join(base_dir, ".env")
+
+
 class ConfigService:
     """
     Configuration management service following Single Responsibility Principle.
@@ -21,6 +31,10 @@ class ConfigService:
     download operations (use DownloadService).
     """
 
+    # Parsed config.json keyed by (path, st_mtime_ns) to avoid re-reading it on every get_base_dir()
+    _user_config_cache = {"key": None, "data": None}
+    _user_config_lock = threading.Lock()
+
     def __init__(self):
         self.config = {}
 
@@ -36,7 +50,7 @@ class ConfigService:
         **Returns:** None
         """
         config_path = ConfigService.get_user_config_path()
-        logger.debug(f"Saving user configuration to: {config_path}")
+        logger.debug("Saving user configuration to: %s", config_path)
         try:
             with open(config_path, "w", encoding="utf-8") as f:
                 json.dump(config, f, indent=2, ensure_ascii=False)
@@ -57,7 +71,7 @@ class ConfigService:
         """
         # The config.json file is placed in the current application directory
         current_dir = os.path.abspath(os.getcwd())
-        logger.debug(f"Current directory for config.json: {current_dir}")
+        logger.debug("Current directory for config.json: %s", current_dir)
         return os.path.join(current_dir, "config.json")
         
 
@@ -67,19 +81,27 @@ class ConfigService:
         Loads the user's custom config.json file.
         Returns an empty dictionary if the file doesn't exist.
         
-        **Description:** Loads user configuration from config.json file.
+        **Description:** Loads user configuration from config.json file, re-parsing it only when its mtime changes.
         **Parameters:** None
         **Returns:** Dict containing user configuration data
         """
         config_path = ConfigService.get_user_config_path()
-        if not os.path.exists(config_path):
+        try:
+            cache_key = (config_path, os.stat(config_path).st_mtime_ns)
+        except OSError:
             logger.debug("User config.json file not found")
             return {}
         
+        with ConfigService._user_config_lock:
+            if ConfigService._user_config_cache["key"] == cache_key:
+                return dict(ConfigService._user_config_cache["data"])
+        
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            logger.debug(f"User configuration loaded from: {config_path}")
+            data = load_json_file(config_path)
+            logger.debug("User configuration loaded from: %s", config_path)
+            with ConfigService._user_config_lock:
+                ConfigService._user_config_cache["key"] = cache_key
+                ConfigService._user_config_cache["data"] = dict(data)
             return data
         except (json.JSONDecodeError, IOError) as e:
             logger.error(f"Error loading {config_path}: {e}")
@@ -94,8 +116,7 @@ class ConfigService:
         **Parameters:** None
         **Returns:** str containing the path to the .env file
         """
-        base_dir = ConfigService.get_base_dir()
-        return os.path.join(base_dir, ".env")
+        return _env_file_path(ConfigService.get_base_dir())
     
     @staticmethod
     def get_workflows_dir() -> str:
@@ -159,7 +180,7 @@ class ConfigService:
             user_config = ConfigService.load_user_config()
             config_base_dir = user_config.get("BASE_DIR", "")
             if config_base_dir:
-                logger.debug(f"Using BASE_DIR from config.json: {config_base_dir}")
+                logger.debug("Using BASE_DIR from config.json: %s", config_base_dir)
                 base_dir = config_base_dir
         except Exception:
             logger.debug("Unable to read BASE_DIR from config.json")
@@ -168,18 +189,17 @@ class ConfigService:
         if not base_dir:
             env_base_dir = os.environ.get("BASE_DIR")
             if env_base_dir:
-                logger.debug(f"Using BASE_DIR from environment variable: {env_base_dir}")
+                logger.debug("Using BASE_DIR from environment variable: %s", env_base_dir)
                 base_dir = env_base_dir
         
         # Priority 3: models.json value (without using cache to avoid recursion)
         if not base_dir and default_value:
             try:
                 if default_value and os.path.exists(default_value):
-                    with open(default_value, "r", encoding="utf-8") as f:
-                        data = json.load(f)
+                    data = load_json_file(default_value)
                     config_base_dir = data.get("config", {}).get("BASE_DIR", "")
                     if config_base_dir:
-                        logger.debug(f"Using BASE_DIR from models.json: {config_base_dir}")
+                        logger.debug("Using BASE_DIR from models.json: %s", config_base_dir)
                         base_dir = config_base_dir
             except Exception:
                 logger.debug("Unable to read BASE_DIR from models.json")
@@ -188,12 +208,12 @@ class ConfigService:
         if not base_dir:
             comfy_dir = os.environ.get("COMFYUI_MODEL_DIR")
             if comfy_dir:
-                logger.debug(f"Using COMFYUI_MODEL_DIR: {comfy_dir}")
+                logger.debug("Using COMFYUI_MODEL_DIR: %s", comfy_dir)
                 base_dir = comfy_dir
         
         # Priority 5: Current directory
         if not base_dir:
             base_dir = os.getcwd()
-            logger.debug(f"Using current directory: {base_dir}")
+            logger.debug("Using current directory: %s", base_dir)
         return base_dir
     
\ No newline at end of file
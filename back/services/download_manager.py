@@ -1,15 +1,21 @@
 import os
-import shutil
+import re
 import requests
 import subprocess
 import threading
 import time
 from typing import Dict, List, Any, Optional
+from .model_manager import ModelManager
 from ..utils.logger import get_logger
+from ..utils.fs_utils import remove_tree
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Hosts that need an authentication token, mapped to their provider name
+PROVIDER_PATTERN = re.compile(r"huggingface\.co|civitai\.com")
+PROVIDERS = {"huggingface.co": "huggingface", "civitai.com": "civitai"}
+
 class DownloadManager:
     """
     Centralized download manager for models following Single Responsibility Principle.
@@ -28,6 +34,12 @@ class DownloadManager:
     PROGRESS: Dict[str, Dict] = {}
     DOWNLOAD_EVENTS: Dict[str, threading.Event] = {}
     STOP_EVENTS: Dict[str, threading.Event] = {}
+    # Guards registration/removal across PROGRESS, DOWNLOAD_EVENTS and STOP_EVENTS
+    _state_lock = threading.Lock()
+    # 1 MiB chunks keep the Python-level loop short for multi-GB files
+    CHUNK_SIZE = 1 << 20
+    # Written data is flushed and dropped from the page cache every PAGE_CACHE_RELEASE_BYTES
+    PAGE_CACHE_RELEASE_BYTES = 64 << 20
 
     @classmethod
     def get_progress(cls, model_id: str) -> Dict[str, Any]:
@@ -50,7 +62,8 @@ class DownloadManager:
         **Parameters:** None
         **Returns:** Dict mapping model IDs to their progress information
         """
-        return {k: v for k, v in cls.PROGRESS.items() if v.get("status") in ["downloading", "stopped"]}
+        with cls._state_lock:
+            return {k: v for k, v in cls.PROGRESS.items() if v.get("status") in ["downloading", "stopped"]}
 
     @classmethod
     def stop_download(cls, model_id: str) -> bool:
@@ -73,7 +86,7 @@ class DownloadManager:
                 try:
                     if os.path.isdir(file_path):
                         # It's a git repository directory
-                        shutil.rmtree(file_path)
+                        remove_tree(file_path)
                         logger.info(f"Removed partial git directory during stop_download: {file_path}")
                     else:
                         # It's a regular file
@@ -89,6 +102,58 @@ class DownloadManager:
             return True
         return False
 
+    @staticmethod
+    def advise_sequential_write(f) -> None:
+        """
+        Hint the kernel that a download file is written sequentially.
+        
+        **Description:** Calls posix_fadvise(POSIX_FADV_SEQUENTIAL) where available (Linux).
+        Failures are ignored, the hint is only an optimization.
+        **Parameters:**
+        - `f` (file object): File opened for writing
+        **Returns:** None
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+    @staticmethod
+    def release_written_pages(f) -> None:
+        """
+        Drop already written download data from the page cache.
+        
+        **Description:** Model files are written once and loaded later by ComfyUI, so keeping them
+        cached only evicts useful pages. Dirty pages cannot be dropped, hence the fdatasync
+        before posix_fadvise(POSIX_FADV_DONTNEED). No-op where posix_fadvise is unavailable.
+        **Parameters:**
+        - `f` (file object): File opened for writing
+        **Returns:** None
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        try:
+            f.flush()
+            os.fdatasync(f.fileno())
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+    @staticmethod
+    def detect_provider(url: str) -> Optional[str]:
+        """
+        Identify the download provider of a URL.
+        
+        **Description:** Scans the URL once for a known token-protected host.
+        **Parameters:**
+        - `url` (str): Download URL
+        **Returns:** "huggingface", "civitai" or None
+        """
+        match = PROVIDER_PATTERN.search(url) if url else None
+        return PROVIDERS[match.group(0)] if match else None
+
     @classmethod
     def cleanup_finished_downloads(cls):
         """
@@ -102,24 +167,25 @@ class DownloadManager:
         current_time = time.time()
         to_remove = []
         
-        for model_id, progress_info in cls.PROGRESS.items():
-            status = progress_info.get("status")
-            finished_time = progress_info.get("finished_time")
-            
-            # Mark finish time if not already marked
-            if status in ["done", "stopped", "error"] and "finished_time" not in progress_info:
-                progress_info["finished_time"] = current_time
-                logger.info(f"Marked download {model_id} as finished at {current_time}")
+        with cls._state_lock:
+            for model_id, progress_info in cls.PROGRESS.items():
+                status = progress_info.get("status")
+                finished_time = progress_info.get("finished_time")
+                
+                # Mark finish time if not already marked
+                if status in ["done", "stopped", "error"] and "finished_time" not in progress_info:
+                    progress_info["finished_time"] = current_time
+                    logger.info(f"Marked download {model_id} as finished at {current_time}")
+                
+                # Remove entries that have been finished for more than 30 seconds
+                elif status in ["done", "stopped", "error"] and finished_time:
+                    if current_time - finished_time > 30:  # 30 seconds
+                        to_remove.append(model_id)
+                        logger.info(f"Cleaning up finished download entry: {model_id} (status: {status})")
             
-            # Remove entries that have been finished for more than 30 seconds
-            elif status in ["done", "stopped", "error"] and finished_time:
-                if current_time - finished_time > 30:  # 30 seconds
-                    to_remove.append(model_id)
-                    logger.info(f"Cleaning up finished download entry: {model_id} (status: {status})")
-        
-        # Remove the entries
-        for model_id in to_remove:
-            cls.PROGRESS.pop(model_id, None)
+            # Remove the entries
+            for model_id in to_remove:
+                cls.PROGRESS.pop(model_id, None)
         
         return len(to_remove)
 
@@ -146,36 +212,36 @@ class DownloadManager:
         - `background` (bool): Whether to run download in background thread
         **Returns:** Dict containing initial progress status
         """
-        # Import here to avoid circular imports
-        from .model_manager import ModelManager
-        
         model_id = entry.get("dest") or entry.get("git")
         if not model_id:
             raise ValueError("Model entry must have 'dest' or 'git'.")
 
-        # Prevent duplicate downloads
-        if model_id in cls.DOWNLOAD_EVENTS:
-            event = cls.DOWNLOAD_EVENTS[model_id]
-            event.wait()
-            return cls.PROGRESS.get(model_id, {"progress": 0, "status": "idle"})
-
-        event = threading.Event()
-        stop_event = threading.Event()
-        cls.DOWNLOAD_EVENTS[model_id] = event
-        cls.STOP_EVENTS[model_id] = stop_event
-        
         # Store the destination path for cleanup purposes
         dest_path = None
         if entry.get("dest"):
             dest_path = ModelManager.resolve_path(entry["dest"], base_dir)
-        elif entry.get("git"):
-            dest_path = ModelManager.resolve_path(entry["dest"], base_dir) if entry.get("dest") else None
-            
-        cls.PROGRESS[model_id] = {
-            "progress": 0, 
-            "status": "downloading",
-            "dest_path": dest_path
-        }
+
+        # Check-and-register atomically so two requests cannot both start the same download
+        with cls._state_lock:
+            existing = cls.DOWNLOAD_EVENTS.get(model_id)
+            if existing is None:
+                event = threading.Event()
+                stop_event = threading.Event()
+                cls.DOWNLOAD_EVENTS[model_id] = event
+                cls.STOP_EVENTS[model_id] = stop_event
+                cls.PROGRESS[model_id] = {
+                    "progress": 0, 
+                    "status": "downloading",
+                    "dest_path": dest_path
+                }
+
+        # Prevent duplicate downloads
+        if existing is not None:
+            if background:
+                # Never block the caller on someone else's download
+                return cls.PROGRESS.get(model_id, {"progress": 0, "status": "downloading"})
+            existing.wait()
+            return cls.PROGRESS.get(model_id, {"progress": 0, "status": "idle"})
 
         def worker():
             try:
@@ -201,9 +267,11 @@ class DownloadManager:
                 cls.PROGRESS[model_id]["status"] = "error"
                 cls.PROGRESS[model_id]["error"] = str(e)
             finally:
+                # Unregister before waking waiters so they never see a finished slot as active
+                with cls._state_lock:
+                    cls.DOWNLOAD_EVENTS.pop(model_id, None)
+                    cls.STOP_EVENTS.pop(model_id, None)
                 event.set()
-                cls.DOWNLOAD_EVENTS.pop(model_id, None)
-                cls.STOP_EVENTS.pop(model_id, None)
                 logger.info(f"Download worker cleanup completed for {model_id}")
 
         if background:
@@ -226,9 +294,6 @@ class DownloadManager:
         - `stop_event` (threading.Event): Event to signal download cancellation
         **Returns:** None
         """
-        # Import here to avoid circular imports
-        from .model_manager import ModelManager
-        
         dest_dir = ModelManager.resolve_path(entry["dest"], base_dir)
         if os.path.exists(dest_dir):
             cls.PROGRESS[model_id]["progress"] = 100
@@ -236,19 +301,53 @@ class DownloadManager:
             return
         os.makedirs(os.path.dirname(dest_dir), exist_ok=True)
         proc = subprocess.Popen(["git", "clone", entry["git"], dest_dir])
-        while proc.poll() is None:
-            if stop_event and stop_event.is_set():
-                proc.terminate()
-                cls.PROGRESS[model_id]["status"] = "stopped"
-                # Remove partial directory
-                if os.path.exists(dest_dir):
-                    try:
-                        shutil.rmtree(dest_dir)
-                        logger.info(f"Removed partial git directory: {dest_dir}")
-                    except Exception as e:
-                        logger.error(f"Failed to remove partial git directory {dest_dir}: {e}")
-                return
-            time.sleep(0.5)
+        if cls.wait_for_process(proc, stop_event):
+            cls.PROGRESS[model_id]["status"] = "stopped"
+            # Remove partial directory
+            if os.path.exists(dest_dir):
+                try:
+                    remove_tree(dest_dir)
+                    logger.info(f"Removed partial git directory: {dest_dir}")
+                except Exception as e:
+                    logger.error(f"Failed to remove partial git directory {dest_dir}: {e}")
+
+    @staticmethod
+    def wait_for_process(proc: subprocess.Popen, stop_event: Optional[threading.Event]) -> bool:
+        """
+        Block until a subprocess exits, terminating it if a stop is requested.
+        
+        **Description:** A daemon watcher thread waits on `stop_event` and terminates the
+        process as soon as it is set, while the caller blocks in `proc.wait()` without polling.
+        The watcher exits once the process has finished.
+        **Parameters:**
+        - `proc` (subprocess.Popen): Running process
+        - `stop_event` (Optional[threading.Event]): Event to signal cancellation
+        **Returns:** bool - True if the process was terminated through `stop_event`; a stop
+        requested after the process exited on its own does not count
+        """
+        if stop_event is None:
+            proc.wait()
+            return False
+
+        done = threading.Event()
+        terminated = threading.Event()
+
+        def watch():
+            # The timeout only bounds how long the watcher lingers after the process exits
+            while not done.is_set():
+                if stop_event.wait(timeout=1.0):
+                    if proc.poll() is None:
+                        terminated.set()
+                        proc.terminate()
+                    return
+
+        threading.Thread(target=watch, daemon=True).start()
+        try:
+            proc.wait()
+        finally:
+            done.set()
+        # A process that still exited cleanly finished its work before the stop landed
+        return terminated.is_set() and proc.returncode != 0
 
     @classmethod
     def _download_url(cls, entry, model_id, hf_token, civitai_token, stop_event):
@@ -280,15 +379,17 @@ class DownloadManager:
         headers = entry.get("headers", {})
         logger.info(f"Initial headers: {headers}")
         
+        provider = cls.detect_provider(url)
+        
         # Handle CivitAI token
-        if "civitai.com" in url and civitai_token:
+        if provider == "civitai" and civitai_token:
             if "token=" not in url:
                 sep = "&" if "?" in url else "?"
                 url = f"{url}{sep}token={civitai_token}"
                 logger.info(f"Added CivitAI token to URL")
         
         # Handle HuggingFace token
-        if "huggingface.co" in url and hf_token:
+        if provider == "huggingface" and hf_token:
             headers["Authorization"] = f"Bearer {hf_token}"
             logger.info(f"Added HuggingFace authorization header")
         
@@ -311,7 +412,10 @@ class DownloadManager:
                 logger.info(f"Opening file for writing: {dest}")
                 
                 with open(dest, "wb") as f:
-                    for chunk in r.iter_content(chunk_size=8192):
+                    cls.advise_sequential_write(f)
+                    next_release = cls.PAGE_CACHE_RELEASE_BYTES
+                    last_progress = -1
+                    for chunk in r.iter_content(chunk_size=cls.CHUNK_SIZE):
                         if stop_event and stop_event.is_set():
                             logger.info(f"Download stopped by user for {model_id}")
                             cls.PROGRESS[model_id]["status"] = "stopped"
@@ -323,12 +427,19 @@ class DownloadManager:
                         if chunk:
                             f.write(chunk)
                             downloaded += len(chunk)
-                            progress = int(downloaded * 100 / total) if total else 0
-                            cls.PROGRESS[model_id]["progress"] = progress
-                            # Log progress every 10%
-                            if progress % 10 == 0 and progress != cls.PROGRESS[model_id].get("last_logged_progress", -1):
-                                logger.info(f"Download progress for {model_id}: {progress}% ({downloaded}/{total} bytes)")
-                                cls.PROGRESS[model_id]["last_logged_progress"] = progress
+                            if downloaded >= next_release:
+                                cls.release_written_pages(f)
+                                next_release = downloaded + cls.PAGE_CACHE_RELEASE_BYTES
+                            progress = downloaded * 100 // total if total else 0
+                            # Only publish whole-percent changes
+                            if progress != last_progress:
+                                last_progress = progress
+                                cls.PROGRESS[model_id]["progress"] = progress
+                                # Log progress every 10%
+                                if progress % 10 == 0:
+                                    logger.info(f"Download progress for {model_id}: {progress}% ({downloaded}/{total} bytes)")
+                    else:
+                        cls.release_written_pages(f)
                 
                 if not stop_event or not stop_event.is_set():
                     file_size = os.path.getsize(dest)
@@ -1,5 +1,4 @@
 import os
-import time
 import threading
 import subprocess
 import requests
@@ -8,6 +7,7 @@ from .model_manager import ModelManager
 from .download_manager import DownloadManager
 from back.services.config_service import ConfigService
 from ..utils.logger import get_logger
+from ..utils.fs_utils import remove_tree, remove_trees
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -16,6 +16,7 @@ logger = get_logger(__name__)
 PROGRESS: Dict[str, Dict] = {}
 DOWNLOAD_EVENTS = {}  # model_id -> threading.Event
 STOP_EVENTS = {}      # model_id -> threading.Event
+STATE_LOCK = threading.Lock()  # guards check-and-register across the three dicts above
 
 
 class DownloadService:
@@ -87,8 +88,20 @@ class DownloadService:
         model_id = DownloadService.get_model_id(entry)
         
         # Synchronization of concurrent downloads for the same model
-        event = DOWNLOAD_EVENTS.get(model_id)
-        if event:
+        with STATE_LOCK:
+            event = DOWNLOAD_EVENTS.get(model_id)
+            if event is None:
+                # No download in progress, register it before releasing the lock
+                event = threading.Event()
+                stop_event = threading.Event()
+                DOWNLOAD_EVENTS[model_id] = event
+                STOP_EVENTS[model_id] = stop_event
+                PROGRESS[model_id] = {"progress": 0, "status": "downloading"}
+                started = True
+            else:
+                started = False
+        
+        if not started:
             # A download is already in progress, wait for completion
             event.wait()
             progress = PROGRESS.get(model_id, {})
@@ -100,14 +113,6 @@ class DownloadService:
                 # Unexpected status, restart download
                 pass
         else:
-            # No download in progress, create a new event
-            event = threading.Event()
-            DOWNLOAD_EVENTS[model_id] = event
-            PROGRESS[model_id] = {"progress": 0, "status": "downloading"}
-            # Add a stop_event for this download
-            stop_event = threading.Event()
-            STOP_EVENTS[model_id] = stop_event
-            
             # Start download in background thread
             thread = threading.Thread(
                 target=DownloadService._download_worker,
@@ -148,10 +153,11 @@ class DownloadService:
                 logger.info(f"Download request - Git: {git_url}")
             
             # Token checks
-            if "huggingface.co" in url and not hf_token:
+            provider = DownloadManager.detect_provider(url)
+            if provider == "huggingface" and not hf_token:
                 results.append({"ok": False, "msg": "HuggingFace token required for this download"})
                 continue
-            if "civitai.com" in url and not civitai_token:
+            if provider == "civitai" and not civitai_token:
                 results.append({"ok": False, "msg": "CivitAI token required for this download"})
                 continue
 
@@ -230,6 +236,7 @@ class DownloadService:
         base_dir = ConfigService.get_base_dir()
         deleted_dests = set()
         results = []
+        pending_dirs = []
         
         for entry in entries:
             dest = entry.get("dest")
@@ -250,18 +257,34 @@ class DownloadService:
             deleted_dests.add(path)
 
             if os.path.exists(path):
+                if os.path.isdir(path):
+                    # Directories are removed together below; the result is filled in afterwards
+                    pending_dirs.append((len(results), path))
+                    results.append(None)
+                    continue
                 try:
-                    if os.path.isfile(path):
-                        os.remove(path)
-                    elif os.path.isdir(path):
-                        import shutil
-                        shutil.rmtree(path)
+                    os.remove(path)
                     results.append({"ok": True})
                 except Exception as e:
                     results.append({"ok": False, "msg": f"Error deleting file: {e}"})
             else:
                 results.append({"ok": False, "msg": f"File not found: {path}"})
         
+        if pending_dirs:
+            try:
+                remove_trees([path for _, path in pending_dirs])
+                for index, _ in pending_dirs:
+                    results[index] = {"ok": True}
+            except Exception:
+                # Retry one by one to report which directory could not be removed
+                for index, path in pending_dirs:
+                    try:
+                        if os.path.exists(path):
+                            remove_tree(path)
+                        results[index] = {"ok": True}
+                    except Exception as e:
+                        results[index] = {"ok": False, "msg": f"Error deleting file: {e}"}
+        
         return results
 
     @staticmethod
@@ -297,9 +320,10 @@ class DownloadService:
             PROGRESS[model_id]["error"] = str(e)
             logger.error(f"Download error for {model_id}: {e}")
         finally:
+            with STATE_LOCK:
+                DOWNLOAD_EVENTS.pop(model_id, None)
+                STOP_EVENTS.pop(model_id, None)
             event.set()
-            DOWNLOAD_EVENTS.pop(model_id, None)
-            STOP_EVENTS.pop(model_id, None)
 
     @staticmethod
     def _download_git_entry(entry: dict, model_id: str, stop_event: Optional[threading.Event] = None) -> None:
@@ -322,13 +346,8 @@ class DownloadService:
         
         os.makedirs(os.path.dirname(dest_dir), exist_ok=True)
         proc = subprocess.Popen(["git", "clone", entry["git"], dest_dir])
-        
-        while proc.poll() is None:
-            if stop_event and stop_event.is_set():
-                proc.terminate()
-                PROGRESS[model_id]["status"] = "stopped"
-                return
-            time.sleep(0.5)
+        if DownloadManager.wait_for_process(proc, stop_event):
+            PROGRESS[model_id]["status"] = "stopped"
 
     @staticmethod
     def _download_url_entry(entry: dict, model_id: str, hf_token: Optional[str] = None, 
@@ -354,12 +373,13 @@ class DownloadService:
         headers = entry.get("headers", {})
         
         # Add tokens if needed
-        if "civitai.com" in url and civitai_token:
+        provider = DownloadManager.detect_provider(url)
+        if provider == "civitai" and civitai_token:
             if "token=" not in url:
                 sep = "&" if "?" in url else "?"
                 url = f"{url}{sep}token={civitai_token}"
         
-        if "huggingface.co" in url and hf_token:
+        if provider == "huggingface" and hf_token:
             if not headers:
                 headers = {}
             headers["Authorization"] = f"Bearer {hf_token}"
@@ -371,11 +391,23 @@ class DownloadService:
         downloaded = 0
         
         with open(dest, "wb") as f:
-            for chunk in r.iter_content(chunk_size=8192):
+            DownloadManager.advise_sequential_write(f)
+            next_release = DownloadManager.PAGE_CACHE_RELEASE_BYTES
+            last_progress = -1
+            progress_info = PROGRESS[model_id]
+            for chunk in r.iter_content(chunk_size=DownloadManager.CHUNK_SIZE):
                 if stop_event and stop_event.is_set():
-                    PROGRESS[model_id]["status"] = "stopped"
+                    progress_info["status"] = "stopped"
                     break
                 if chunk:
                     f.write(chunk)
                     downloaded += len(chunk)
-                    PROGRESS[model_id]["progress"] = int(downloaded * 100 / total) if total else 0
+                    if downloaded >= next_release:
+                        DownloadManager.release_written_pages(f)
+                        next_release = downloaded + DownloadManager.PAGE_CACHE_RELEASE_BYTES
+                    progress = downloaded * 100 // total if total else 0
+                    if progress != last_progress:
+                        last_progress = progress
+                        progress_info["progress"] = progress
+            else:
+                DownloadManager.release_written_pages(f)
@@ -9,18 +9,34 @@ This module contains all business logic for file management including:
 """
 
 import os
+import re
 import shutil
-import json
-from typing import List, Dict, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from stat import S_ISDIR, S_ISREG
+from typing import List, Dict, Any, Optional, Tuple
 
 from .config_service import ConfigService
 from datetime import datetime
 from .model_manager import ModelManager
 from ..utils.logger import get_logger
+from ..utils.fs_utils import copy_file_object, remove_tree
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# File extensions counted as model files by get_models_info
+MODEL_EXTENSIONS = frozenset({'.ckpt', '.safetensors', '.pt', '.pth', '.bin'})
+# Leading ${BASE_DIR} placeholder of models.json destinations, with either separator
+BASE_DIR_PREFIX = re.compile(r"^\$\{BASE_DIR\}(?:[\\/]|$)")
+
+
+@lru_cache(maxsize=8)
+def _absolute_base(base: str) -> str:
+    # The working directory does not change while the server runs, so a base's absolute form is stable
+    return os.path.abspath(base)
+
 
 class FileManagerService:
     """
@@ -38,6 +54,14 @@ class FileManagerService:
     authentication (use AuthService).
     """
     
+    # Parsed models.json registrations keyed on (models.json path, st_mtime_ns, base_dir),
+    # with the ModelManager data they were built from (None if models.json could not be read)
+    _registered_cache = {"key": None, "data": None, "entries": None, "directories": frozenset()}
+    _registered_lock = threading.Lock()
+    # list_files stats entries on a thread pool from this many directory entries on
+    LIST_PARALLEL_THRESHOLD = 256
+    LIST_MAX_WORKERS = 8
+    
     def __init__(self):
         """Initialize the file manager service."""
         self.base_dir = ConfigService.get_base_dir()
@@ -53,12 +77,93 @@ class FileManagerService:
         **Returns:** Safe absolute path
         **Raises:** HTTPException if path is outside base directory
         """
-        base = os.path.abspath(base)
-        path = os.path.abspath(os.path.join(base, *paths))
-        if not path.startswith(base):
+        base = _absolute_base(base)
+        # base is already absolute, so normpath is enough and avoids abspath's getcwd call
+        path = os.path.normpath(os.path.join(base, *paths))
+        if path != base and not path.startswith(base.rstrip(os.sep) + os.sep):
             raise ValueError("Access denied: path outside allowed directory")
         return path
     
+    def _load_registered_entries(self) -> Tuple[Dict[str, tuple], frozenset]:
+        """
+        Map registered model paths to their models.json entry.
+        
+        **Description:** Reads models.json through ModelManager, so saved changes not yet
+        flushed to disk are included, and keeps the result until the file or the data served
+        by ModelManager changes. A missing or unreadable models.json is cached as having no
+        registrations, so listings neither retry the parse nor repeat the log message.
+        The returned objects are shared with the cache and must not be mutated.
+        **Parameters:** None
+        **Returns:** Tuple of (dictionary of absolute normalized path -> (group name, model dict),
+        frozenset of the directories directly containing those paths)
+        """
+        models_path = ModelManager.get_models_json_path()
+        try:
+            st = os.stat(models_path) if models_path else None
+        except OSError:
+            st = None
+        if st is None or not S_ISREG(st.st_mode):
+            # Cache the miss too, so listings neither retry the parse nor repeat the warning
+            key = (models_path, None, self.base_dir)
+            with FileManagerService._registered_lock:
+                if FileManagerService._registered_cache["key"] != key:
+                    logger.warning("No models.json file found")
+                    FileManagerService._registered_cache.update(
+                        key=key, data=None, entries={}, directories=frozenset()
+                    )
+            return {}, frozenset()
+        
+        key = (models_path, st.st_mtime_ns, self.base_dir)
+        with FileManagerService._registered_lock:
+            cache = FileManagerService._registered_cache
+            # A models.json that could not be read is not retried until the file changes
+            if cache["key"] == key and cache["data"] is None:
+                return cache["entries"], cache["directories"]
+        
+        try:
+            models_data = ModelManager.load_models_json()
+        except Exception as e:
+            with FileManagerService._registered_lock:
+                if FileManagerService._registered_cache["key"] != key:
+                    logger.error(f"Error reading models.json: {e}")
+                    FileManagerService._registered_cache.update(
+                        key=key, data=None, entries={}, directories=frozenset()
+                    )
+            return {}, frozenset()
+        
+        with FileManagerService._registered_lock:
+            cache = FileManagerService._registered_cache
+            if cache["key"] == key and cache["data"] is models_data:
+                return cache["entries"], cache["directories"]
+        
+        entries = {}
+        # Process each group
+        for group_name, models in models_data.get('groups', {}).items():
+            for model in models:
+                dest = model.get('dest')
+                if dest:
+                    # Canonical key: absolute normalized path, matched as-is by the listings
+                    full_path = os.path.join(self.base_dir, BASE_DIR_PREFIX.sub("", dest, count=1))
+                    entries[os.path.abspath(full_path)] = (group_name, model)
+        
+        directories = frozenset(os.path.dirname(model_path) for model_path in entries)
+        with FileManagerService._registered_lock:
+            FileManagerService._registered_cache.update(
+                key=key, data=models_data, entries=entries, directories=directories
+            )
+        return entries, directories
+    
+    def get_registered_paths(self) -> Dict[str, tuple]:
+        """
+        Get the paths of all registered models.
+        
+        **Description:** Cheap membership lookup for listings; unlike get_registered_models
+        it does not stat the model files.
+        **Parameters:** None
+        **Returns:** Dictionary keyed on normalized absolute model paths
+        """
+        return self._load_registered_entries()[0]
+    
     def get_registered_models(self) -> Dict[str, Any]:
         """
         Get all registered models from models.json.
@@ -69,41 +174,20 @@ class FileManagerService:
         """
         registered_files = {}
         
-        models_path = ModelManager.get_models_json_path()
-        if not models_path or not os.path.isfile(models_path):
-            logger.warning("No models.json file found")
-            return registered_files
-        
-        try:
-            with open(models_path, 'r', encoding='utf-8') as f:
-                models_data = json.load(f)
-            
-            # Process each group
-            for group_name, models in models_data.get('groups', {}).items():
-                for model in models:
-                    dest = model.get('dest')
-                    if dest:
-                        # Normalize path
-                        full_path = os.path.join(self.base_dir, dest)
-                        normalized_path = os.path.normpath(full_path)
-                        
-                        # Get file size if it exists
-                        file_size = 0
-                        if os.path.isfile(normalized_path):
-                            try:
-                                file_size = os.path.getsize(normalized_path)
-                            except OSError:
-                                pass
-                        
-                        registered_files[normalized_path] = {
-                            'group': group_name,
-                            'model_info': model,
-                            'size': file_size,
-                            'exists': os.path.isfile(normalized_path)
-                        }
-        
-        except Exception as e:
-            logger.error(f"Error reading models.json: {e}")
+        for model_path, (group_name, model) in self._load_registered_entries()[0].items():
+            # Get file size if it exists
+            try:
+                st = os.stat(model_path)
+                exists = S_ISREG(st.st_mode)
+            except OSError:
+                exists = False
+            
+            registered_files[model_path] = {
+                'group': group_name,
+                'model_info': model,
+                'size': st.st_size if exists else 0,
+                'exists': exists
+            }
         
         return registered_files
     
@@ -123,19 +207,19 @@ class FileManagerService:
                 raise FileNotFoundError(f"Directory not found: {path}")
             
             directories = []
-            for item in os.listdir(full_path):
-                item_path = os.path.join(full_path, item)
-                if os.path.isdir(item_path):
-                    try:
-                        stat = os.stat(item_path)
-                        directories.append({
-                            'name': item,
-                            'path': os.path.relpath(item_path, self.base_dir),
-                            'type': 'directory',
-                            'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
-                        })
-                    except OSError as e:
-                        logger.warning(f"Could not stat directory {item}: {e}")
+            with os.scandir(full_path) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        try:
+                            stat = entry.stat()
+                            directories.append({
+                                'name': entry.name,
+                                'path': os.path.relpath(entry.path, self.base_dir),
+                                'type': 'directory',
+                                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
+                            })
+                        except OSError as e:
+                            logger.warning(f"Could not stat directory {entry.name}: {e}")
             
             return sorted(directories, key=lambda x: x['name'].lower())
         
@@ -143,37 +227,41 @@ class FileManagerService:
             logger.error(f"Error listing directories: {e}")
             raise
     
-    def list_all_directories(self) -> List[Dict[str, Any]]:
+    def list_all_directories(self, max_depth: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Recursively list all directories in a tree structure.
         
         **Description:** Returns a hierarchical tree structure of all directories with children nested.
-        **Parameters:** None
+        Directories below `max_depth` are not scanned and get `children` set to None, so
+        clients can fetch them on demand with list_directories.
+        **Parameters:**
+        - `max_depth` (int, optional): Number of levels to scan; None scans the whole tree
         **Returns:** List of root directories with nested children structure
         """
-        def _build_directory_tree(path: str) -> List[Dict[str, Any]]:
+        def _build_directory_tree(path: str, depth: Optional[int]) -> List[Dict[str, Any]]:
             """Recursively build directory tree structure."""
             directories = []
             
             try:
-                if not os.path.exists(path):
-                    return directories
+                with os.scandir(path) as it:
+                    subdirs = [entry for entry in it if entry.is_dir()]
                 
-                for item in os.listdir(path):
-                    item_path = os.path.join(path, item)
-                    if os.path.isdir(item_path):
-                        try:
-                            stat = os.stat(item_path)
-                            directory_info = {
-                                'name': item,
-                                'path': os.path.relpath(item_path, self.base_dir),
-                                'type': 'directory',
-                                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                                'children': _build_directory_tree(item_path)
-                            }
-                            directories.append(directory_info)
-                        except OSError as e:
-                            logger.warning(f"Could not stat directory {item}: {e}")
+                for entry in subdirs:
+                    try:
+                        stat = entry.stat()
+                        directory_info = {
+                            'name': entry.name,
+                            'path': os.path.relpath(entry.path, self.base_dir),
+                            'type': 'directory',
+                            'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                            'children': (
+                                None if depth == 1
+                                else _build_directory_tree(entry.path, None if depth is None else depth - 1)
+                            )
+                        }
+                        directories.append(directory_info)
+                    except OSError as e:
+                        logger.warning(f"Could not stat directory {entry.name}: {e}")
                 
                 return sorted(directories, key=lambda x: x['name'].lower())
             
@@ -182,7 +270,10 @@ class FileManagerService:
                 return directories
         
         try:
-            return _build_directory_tree(self.base_dir)
+            # Checked once here; subdirectories come straight from scandir
+            if not os.path.exists(self.base_dir):
+                return []
+            return _build_directory_tree(self.base_dir, max_depth)
         
         except Exception as e:
             logger.error(f"Error listing all directories: {e}")
@@ -204,43 +295,63 @@ class FileManagerService:
             if not os.path.exists(full_path):
                 raise FileNotFoundError(f"Directory not found: {path}")
             
-            registered_models = self.get_registered_models()
             files = []
             directories = []
             total_size = 0
             
-            for item in os.listdir(full_path):
-                item_path = os.path.join(full_path, item)
+            wanted_extensions = {e.lower() for e in extensions} if extensions else None
+            # Entry paths are built from the listed directory's relative path instead of one relpath per entry
+            relative_dir = os.path.relpath(full_path, self.base_dir)
+            if relative_dir == os.curdir:
+                relative_dir = ""
+            # Registration keys are absolute paths; normalize the directory once, not every entry
+            absolute_dir = os.path.abspath(full_path)
+            # Directories without registered models skip the per-file lookups entirely
+            registered_models, registered_dirs = self._load_registered_entries()
+            if absolute_dir not in registered_dirs:
+                registered_models = {}
+            
+            with os.scandir(full_path) as it:
+                entries = list(it)
+            
+            # Large model directories: overlap the per-entry stat calls on a thread pool
+            if len(entries) >= self.LIST_PARALLEL_THRESHOLD:
+                with ThreadPoolExecutor(max_workers=self.LIST_MAX_WORKERS) as executor:
+                    stats = list(executor.map(self._stat_entry, entries))
+            else:
+                stats = [self._stat_entry(entry) for entry in entries]
+            
+            for entry, stat in zip(entries, stats):
+                item = entry.name
                 
-                try:
-                    stat = os.stat(item_path)
-                    item_info = {
-                        'name': item,
-                        'path': os.path.relpath(item_path, self.base_dir),
-                        'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        'permissions': oct(stat.st_mode)[-3:]
-                    }
-                    
-                    if os.path.isdir(item_path):
-                        item_info['type'] = 'directory'
-                        directories.append(item_info)
-                    else:
-                        # Filter by extensions if specified
-                        if extensions:
-                            _, ext = os.path.splitext(item.lower())
-                            if ext not in [e.lower() for e in extensions]:
-                                continue
-                        
-                        item_info.update({
-                            'type': 'file',
-                            'size': stat.st_size,
-                            'is_registered': os.path.abspath(item_path) in registered_models
-                        })
-                        total_size += stat.st_size
-                        files.append(item_info)
+                if isinstance(stat, OSError):
+                    logger.warning(f"Could not stat item {item}: {stat}")
+                    continue
+                
+                item_info = {
+                    'name': item,
+                    'path': os.path.join(relative_dir, item),
+                    'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                    'permissions': oct(stat.st_mode)[-3:]
+                }
                 
-                except OSError as e:
-                    logger.warning(f"Could not stat item {item}: {e}")
+                if S_ISDIR(stat.st_mode):
+                    item_info['type'] = 'directory'
+                    directories.append(item_info)
+                else:
+                    # Filter by extensions if specified
+                    if wanted_extensions:
+                        _, ext = os.path.splitext(item.lower())
+                        if ext not in wanted_extensions:
+                            continue
+                    
+                    item_info.update({
+                        'type': 'file',
+                        'size': stat.st_size,
+                        'is_registered': os.path.join(absolute_dir, item) in registered_models
+                    })
+                    total_size += stat.st_size
+                    files.append(item_info)
             
             return {
                 'path': path,
@@ -254,6 +365,21 @@ class FileManagerService:
             logger.error(f"Error listing files: {e}")
             raise
     
+    @staticmethod
+    def _stat_entry(entry: os.DirEntry):
+        """
+        Stat a directory entry without raising.
+        
+        **Description:** Follows symlinks like os.stat. Used by list_files, possibly from worker threads.
+        **Parameters:**
+        - `entry` (os.DirEntry): Entry returned by os.scandir
+        **Returns:** os.stat_result, or the OSError raised by the stat call
+        """
+        try:
+            return entry.stat()
+        except OSError as e:
+            return e
+    
     def copy_file(self, source_path: str, target_path: str) -> None:
         """
         Copy a file or directory.
@@ -307,7 +433,7 @@ class FileManagerService:
                 raise FileNotFoundError(f"File not found: {file_path}")
             
             if os.path.isdir(full_path):
-                shutil.rmtree(full_path)
+                remove_tree(full_path)
             else:
                 os.remove(full_path)
             
@@ -364,21 +490,23 @@ class FileManagerService:
         try:
             full_path = self.safe_join(self.base_dir, file_path)
             
-            if not os.path.exists(full_path):
+            # One stat answers existence, type and metadata
+            try:
+                stat = os.stat(full_path)
+            except FileNotFoundError:
                 raise FileNotFoundError(f"File not found: {file_path}")
-            
-            stat = os.stat(full_path)
-            registered_models = self.get_registered_models()
+            registered_models = self.get_registered_paths()
             
             properties = {
                 'name': os.path.basename(full_path),
                 'path': file_path,
                 'size': stat.st_size,
-                'type': 'directory' if os.path.isdir(full_path) else 'file',
+                'type': 'directory' if S_ISDIR(stat.st_mode) else 'file',
                 'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
                 'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
                 'permissions': oct(stat.st_mode)[-3:],
-                'is_registered': os.path.abspath(full_path) in registered_models
+                # safe_join already returns an absolute normalized path
+                'is_registered': full_path in registered_models
             }
             
             return properties
@@ -430,7 +558,7 @@ class FileManagerService:
             
             # Save file
             with open(full_path, "wb") as buffer:
-                shutil.copyfileobj(upload_file.file, buffer)
+                copy_file_object(upload_file.file, buffer)
             
             # Get file stats
             stat = os.stat(full_path)
@@ -461,26 +589,28 @@ class FileManagerService:
             registered_models = self.get_registered_models()
             
             # Find all model files (common extensions)
-            model_extensions = ['.ckpt', '.safetensors', '.pt', '.pth', '.bin']
             all_model_files = []
             total_size = 0
             
             for root, dirs, files in os.walk(self.base_dir):
+                absolute_root = os.path.abspath(root)
+                relative_root = os.path.relpath(root, self.base_dir)
+                if relative_root == os.curdir:
+                    relative_root = ""
                 for file in files:
                     _, ext = os.path.splitext(file.lower())
-                    if ext in model_extensions:
+                    if ext in MODEL_EXTENSIONS:
                         file_path = os.path.join(root, file)
                         try:
                             stat = os.stat(file_path)
-                            relative_path = os.path.relpath(file_path, self.base_dir)
                             
                             file_info = {
                                 'name': file,
-                                'path': relative_path,
+                                'path': os.path.join(relative_root, file),
                                 'size': stat.st_size,
                                 'type': 'file',
                                 'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                                'is_registered': os.path.abspath(file_path) in registered_models
+                                'is_registered': os.path.join(absolute_root, file) in registered_models
                             }
                             
                             all_model_files.append(file_info)
@@ -9,7 +9,9 @@ This module contains business logic for JSON model management including:
 """
 
 import os
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 
 from .config_service import ConfigService
 from .model_manager import ModelManager
@@ -19,6 +21,96 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _normalize_path(path: str, base_dir: str) -> str:
+    """
+    Normalize a path against a base directory.
+
+    **Description:** Pure implementation of JsonModelsService.normalize_path, memoized on
+    (path, base_dir) since the same destinations are normalized again on every add/update.
+    **Parameters:**
+    - `path` (str): Non-empty path to normalize
+    - `base_dir` (str): Base directory for relative paths
+    **Returns:** Normalized path string
+    """
+    # Convert all backslashes to forward slashes
+    path = path.replace('\\', '/')
+    
+    # If the path already contains ${BASE_DIR}, don't modify it
+    if "${BASE_DIR}" in path:
+        return path
+    
+    # Relative paths only need the prefix; base_dir matters for absolute paths alone
+    if not os.path.isabs(path):
+        return path if path.startswith('/') else f"${{BASE_DIR}}/{path}"
+    
+    # Normalize the base_dir as well, removing the trailing slash for consistency
+    base_dir = base_dir.replace('\\', '/')
+    if base_dir.endswith('/'):
+        base_dir = base_dir[:-1]
+    
+    # If path starts with base_dir, make it relative with ${BASE_DIR}
+    path_normalized = os.path.normpath(path).replace('\\', '/')
+    base_dir_normalized = os.path.normpath(base_dir).replace('\\', '/')
+    
+    if path_normalized.startswith(base_dir_normalized):
+        relative_part = path_normalized[len(base_dir_normalized):].lstrip('/')
+        if relative_part:
+            return f"${{BASE_DIR}}/{relative_part}"
+        else:
+            return "${BASE_DIR}"
+    
+    # Absolute paths outside base_dir without a leading slash (Windows drives) get the prefix
+    if not path.startswith('/'):
+        return f"${{BASE_DIR}}/{path}"
+    
+    return path
+
+
+def _resolve_dest(entry: Dict[str, Any], base_dir: str) -> Optional[str]:
+    """
+    Resolve the destination of a model entry to a file system path.
+
+    **Description:** Substitutes ${BASE_DIR} and makes relative paths absolute.
+    **Parameters:**
+    - `entry` (Dict[str, Any]): Model entry with dest field
+    - `base_dir` (str): Base directory to resolve relative paths
+    **Returns:** The resolved path, or None if the entry has no dest
+    """
+    dest = entry.get("dest")
+    if not dest:
+        return None
+    
+    # Resolve ${BASE_DIR} variable
+    if "${BASE_DIR}" in dest:
+        dest = dest.replace("${BASE_DIR}", base_dir)
+    
+    # Convert to absolute path if relative
+    if not os.path.isabs(dest):
+        dest = os.path.join(base_dir, dest)
+    
+    return dest
+
+
+def _list_regular_files(directory: str) -> Optional[set]:
+    """
+    List the names of the regular files in a directory.
+
+    **Description:** Symlinks are followed, as with os.path.isfile.
+    **Parameters:**
+    - `directory` (str): Directory to list
+    **Returns:** Set of file names (empty if the directory does not exist), or None if it
+    could not be listed and entries must be checked individually
+    """
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+    except OSError:
+        return None
+
+
 class JsonModelsService:
     """
     JSON model configuration service following Single Responsibility Principle.
@@ -35,6 +127,11 @@ class JsonModelsService:
     file operations to ModelManager and status tracking to other services.
     """
     
+    # Existence probes (directory listings and single-file checks) run on a thread pool
+    # from this many probes on, so slow or networked storage is queried concurrently
+    EXISTS_PARALLEL_THRESHOLD = 32
+    EXISTS_MAX_WORKERS = 8
+    
     def __init__(self):
         """Initialize the JSON models service."""
         self.base_dir = ConfigService.get_base_dir()
@@ -51,42 +148,10 @@ class JsonModelsService:
         """
         if not path:
             return path
-        
-        # Convert all backslashes to forward slashes
-        path = path.replace('\\', '/')
-        
-        # If the path already contains ${BASE_DIR}, don't modify it
-        if "${BASE_DIR}" in path:
+        # Stored destinations are usually normalized already; skip the cache lookup for them
+        if path.startswith("${BASE_DIR}/") and "\\" not in path:
             return path
-        
-        # If base_dir is not provided, use the centralized BASE_DIR
-        if not base_dir:
-            base_dir = self.base_dir
-        
-        # Normalize the base_dir as well
-        base_dir = base_dir.replace('\\', '/')
-        
-        # Remove trailing slash from base_dir for consistency
-        if base_dir.endswith('/'):
-            base_dir = base_dir[:-1]
-        
-        # If path is absolute and starts with base_dir, make it relative with ${BASE_DIR}
-        if os.path.isabs(path):
-            path_normalized = os.path.normpath(path).replace('\\', '/')
-            base_dir_normalized = os.path.normpath(base_dir).replace('\\', '/')
-            
-            if path_normalized.startswith(base_dir_normalized):
-                relative_part = path_normalized[len(base_dir_normalized):].lstrip('/')
-                if relative_part:
-                    return f"${{BASE_DIR}}/{relative_part}"
-                else:
-                    return "${BASE_DIR}"
-        
-        # If path is relative, add ${BASE_DIR}/ prefix
-        if not path.startswith('/') and not path.startswith('${BASE_DIR}'):
-            return f"${{BASE_DIR}}/{path}"
-        
-        return path
+        return _normalize_path(path, base_dir or self.base_dir)
     
     def model_exists_on_disk(self, entry: Dict[str, Any], base_dir: Optional[str] = None) -> bool:
         """
@@ -98,22 +163,19 @@ class JsonModelsService:
         - `base_dir` (str, optional): Base directory to resolve relative paths
         **Returns:** True if model file exists, False otherwise
         """
-        if not base_dir:
-            base_dir = self.base_dir
-        
-        dest = entry.get("dest")
-        if not dest:
-            return False
-        
-        # Resolve ${BASE_DIR} variable
-        if "${BASE_DIR}" in dest:
-            dest = dest.replace("${BASE_DIR}", base_dir)
-        
-        # Convert to absolute path if relative
-        if not os.path.isabs(dest):
-            dest = os.path.join(base_dir, dest)
+        dest = _resolve_dest(entry, base_dir or self.base_dir)
+        return bool(dest) and os.path.isfile(dest)
+    
+    def get_models_etag(self) -> Optional[str]:
+        """
+        Get the ETag of the current models.json content.
         
-        return os.path.isfile(dest)
+        **Description:** Lets read endpoints answer conditional requests without rebuilding
+        responses that only depend on models.json.
+        **Parameters:** None
+        **Returns:** Weak ETag string, or None if unavailable
+        """
+        return ModelManager.get_models_json_etag()
     
     def get_models_data_with_existence(self) -> Dict[str, Any]:
         """
@@ -126,11 +188,47 @@ class JsonModelsService:
         data = ModelManager.load_models_json()
         base_dir = self.base_dir
         
-        # Add 'exists' field for each model in each group
+        # Resolve every destination first, grouped by parent directory
         groups = data.get("groups", {})
-        for group_name, entries in groups.items():
+        resolved = []
+        entries_per_dir: Dict[str, int] = {}
+        for entries in groups.values():
             for entry in entries:
-                entry["exists"] = self.model_exists_on_disk(entry, base_dir)
+                dest = _resolve_dest(entry, base_dir)
+                resolved.append((entry, dest))
+                if dest:
+                    directory = os.path.dirname(dest)
+                    entries_per_dir[directory] = entries_per_dir.get(directory, 0) + 1
+        
+        # One listing per directory holding several entries instead of one stat per entry
+        listed_dirs = [directory for directory, count in entries_per_dir.items() if count > 1]
+        single_dests = [
+            dest for _, dest in resolved
+            if dest and entries_per_dir[os.path.dirname(dest)] == 1
+        ]
+        if len(listed_dirs) + len(single_dests) >= self.EXISTS_PARALLEL_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=self.EXISTS_MAX_WORKERS) as executor:
+                listings = executor.map(_list_regular_files, listed_dirs)
+                single_results = executor.map(os.path.isfile, single_dests)
+                present_files = dict(zip(listed_dirs, listings))
+                single_exists = dict(zip(single_dests, single_results))
+        else:
+            present_files = {directory: _list_regular_files(directory) for directory in listed_dirs}
+            single_exists = {dest: os.path.isfile(dest) for dest in single_dests}
+        
+        # Add 'exists' field for each model in each group
+        for entry, dest in resolved:
+            if not dest:
+                entry["exists"] = False
+                continue
+            if dest in single_exists:
+                entry["exists"] = single_exists[dest]
+                continue
+            names = present_files.get(os.path.dirname(dest))
+            if names is None:
+                entry["exists"] = os.path.isfile(dest)
+            else:
+                entry["exists"] = os.path.basename(dest) in names
         
         return data
     
@@ -202,7 +300,7 @@ class JsonModelsService:
         saved_order = config.get("group_order", [])
         
         # If saved order exists and contains all groups, use it
-        if saved_order and set(saved_order) == set(groups.keys()):
+        if saved_order and groups.keys() == set(saved_order):
             return saved_order
         
         # Otherwise, return alphabetical order
@@ -483,6 +581,69 @@ class JsonModelsService:
             "message": message
         }
     
+    def update_model_entries(self, entries: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Update or add several model entries at once.
+        
+        **Description:** Applies update_model_entry semantics to each (group, entry) pair with a
+        single load and a single save of models.json. Entries are matched by dest or git through
+        an identifier index built once per group. Entries without an identifier are reported as
+        failed and skipped.
+        **Parameters:**
+        - `entries` (List[Tuple[str, Dict[str, Any]]]): Pairs of target group name and entry data
+        **Returns:** Dictionary with success status, message and one result per entry
+        """
+        data = ModelManager.load_models_json()
+        groups = data.setdefault("groups", {})
+        
+        indexes: Dict[str, Dict[str, int]] = {}
+        results = []
+        saved = 0
+        for group_name, entry in entries:
+            # Normalize the destination path
+            if entry.get("dest"):
+                entry["dest"] = self.normalize_path(entry["dest"])
+            
+            model_id = entry.get("dest") or entry.get("git")
+            if not model_id:
+                results.append({
+                    "group": group_name,
+                    "ok": False,
+                    "message": "Entry must have either dest or git field"
+                })
+                continue
+            
+            group_entries = groups.setdefault(group_name, [])
+            index = indexes.get(group_name)
+            if index is None:
+                index = {}
+                for i, existing_entry in enumerate(group_entries):
+                    # First match wins, as in update_model_entry
+                    index.setdefault(existing_entry.get("dest") or existing_entry.get("git"), i)
+                indexes[group_name] = index
+            
+            existing_index = index.get(model_id)
+            if existing_index is None:
+                index[model_id] = len(group_entries)
+                group_entries.append(entry)
+                message = "Model entry added"
+            else:
+                group_entries[existing_index] = entry
+                message = "Model entry updated"
+            
+            results.append({"group": group_name, "id": model_id, "ok": True, "message": message})
+            saved += 1
+        
+        if saved:
+            ModelManager.save_models_json(data)
+        
+        logger.info(f"{saved} of {len(entries)} model entries saved")
+        return {
+            "ok": True,
+            "message": f"{saved} of {len(entries)} model entries saved",
+            "results": results
+        }
+    
     def delete_model_entry(self, group_name: str, entry: Dict[str, Any]) -> Dict[str, Any]:
         """
         Delete a model entry from a group.
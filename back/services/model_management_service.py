@@ -3,7 +3,9 @@ from typing import Dict, List, Optional, Any
 from .model_manager import ModelManager
 from .download_manager import DownloadManager
 from .config_service import ConfigService
+from .json_models_service import JsonModelsService
 from ..utils.logger import get_logger
+from ..utils.fs_utils import remove_tree
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -194,7 +196,6 @@ class ModelManagementService:
         base_dir = data.get("config", {}).get("BASE_DIR", "")
         if entry.get("dest"):
             try:
-                from back.services.json_models_service import JsonModelsService
                 json_service = JsonModelsService()
                 entry["dest"] = json_service.normalize_path(entry["dest"], base_dir)
             except ImportError:
@@ -231,7 +232,6 @@ class ModelManagementService:
         base_dir = data.get("config", {}).get("BASE_DIR", "")
         if entry.get("dest"):
             try:
-                from back.services.json_models_service import JsonModelsService
                 json_service = JsonModelsService()
                 entry["dest"] = json_service.normalize_path(entry["dest"], base_dir)
             except ImportError:
@@ -317,8 +317,7 @@ class ModelManagementService:
             if os.path.isfile(file_path):
                 os.remove(file_path)
             elif os.path.isdir(file_path):
-                import shutil
-                shutil.rmtree(file_path)
+                remove_tree(file_path)
             return True
         except OSError as e:
             raise ValueError(f"Failed to delete file: {e}")
@@ -2,13 +2,17 @@ import os
 import json
 import shutil
 import subprocess
+import threading
 import time
 import copy
+import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 from fastapi import HTTPException
 
 from .config_service import ConfigService
 from ..utils.logger import get_logger
+from ..utils.json_utils import dumps_json, load_json_file, loads_json
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -31,14 +35,29 @@ class ModelManager:
     complex bundle operations (use BundleService).
     """
     
+    # Maximum number of workflow files copied concurrently during a bundle install
+    WORKFLOW_COPY_WORKERS = 8
+    
+    # Delay before saved models.json changes hit the disk, so a burst of edits is written once
+    SAVE_DEBOUNCE_SECONDS = 0.05
+    # Upper bound of the retry delay after a failed models.json write
+    SAVE_RETRY_MAX_SECONDS = 5.0
+    
     # Cache to avoid repeated reloads
     _cache = {
         "models_json_data": None,
+        "models_json_key": None,  # (path, st_mtime_ns, st_size) of the cached models.json
         "models_json_path": None,
+        "models_json_pending": None,  # path the cached data still has to be written to
+        "models_json_payload": None,  # serialized snapshot of the pending changes
+        "models_json_written": None,  # (cache key, bytes) of the last models.json written
         "base_dir": None,
         "last_load_time": 0,
-        "cache_ttl": 30  # Cache valid for 30 seconds
+        "cache_ttl": 30  # Path cache valid for 30 seconds
     }
+    _cache_lock = threading.Lock()
+    _flush_timer: Optional[threading.Timer] = None
+    _flush_failures = 0  # consecutive failed writes of the pending changes
     
     @staticmethod
     def _is_cache_valid() -> bool:
@@ -61,6 +80,7 @@ class ModelManager:
         **Returns:** None
         """
         ModelManager._cache["models_json_data"] = None
+        ModelManager._cache["models_json_key"] = None
         ModelManager._cache["models_json_path"] = None
         ModelManager._cache["base_dir"] = None
         ModelManager._cache["last_load_time"] = 0
@@ -108,8 +128,9 @@ class ModelManager:
         
         # Mettre en cache
         ModelManager._cache["models_json_path"] = models_path
+        ModelManager._cache["last_load_time"] = time.time()
         
-        logger.debug(f"Chemin models.json déterminé: {models_path}")
+        logger.debug("Chemin models.json déterminé: %s", models_path)
         return models_path
     
     @staticmethod
@@ -118,29 +139,91 @@ class ModelManager:
         Charge le fichier models.json complet avec cache
         
         **Description:** Loads the complete models.json file with caching support.
+        The parsed data is reused until the file's modification time changes.
         **Parameters:** None
         **Returns:** Dict containing the models.json data structure
         """
+        models_path = ModelManager.get_models_json_path()
+        
+        with ModelManager._cache_lock:
+            return ModelManager._load_models_json_locked(models_path)
+    
+    @staticmethod
+    def get_models_json_etag() -> Optional[str]:
+        """
+        Build a weak ETag for the current content of models.json.
+        
+        **Description:** Derived from the file's mtime and size after bringing the cache up to
+        date. No ETag is produced while saved changes are still waiting to be written, since the
+        file on disk does not describe them yet.
+        **Parameters:** None
+        **Returns:** str ETag value, or None if none can be computed
+        """
+        models_path = ModelManager.get_models_json_path()
+        
+        with ModelManager._cache_lock:
+            ModelManager._load_models_json_locked(models_path)
+            if ModelManager._cache["models_json_pending"] == models_path:
+                return None
+            cache_key = ModelManager._cache["models_json_key"]
+        
+        if not cache_key or cache_key[0] != models_path:
+            return None
+        return f'W/"{cache_key[1]:x}-{cache_key[2]:x}"'
+    
+    @staticmethod
+    def _models_json_key(models_path: str) -> tuple:
+        """
+        Build the cache key identifying the current content of models.json.
+        
+        **Description:** Stats the file; the size catches rewrites landing within the same mtime tick.
+        **Parameters:**
+        - `models_path` (str): Full path to models.json
+        **Returns:** tuple of (path, st_mtime_ns, st_size)
+        **Raises:** OSError if the file cannot be stat'ed
+        """
+        st = os.stat(models_path)
+        return (models_path, st.st_mtime_ns, st.st_size)
+    
+    @staticmethod
+    def _load_models_json_locked(models_path: str) -> Dict:
+        """
+        Loads models.json from disk unless the cached copy is still current.
+        Must be called with _cache_lock held.
+        
+        **Description:** Stats models.json and only parses it when its mtime changed.
+        **Parameters:**
+        - `models_path` (str): Full path to models.json
+        **Returns:** Dict containing the models.json data structure
+        """
+        # Saved changes not flushed yet are newer than the file on disk
+        if ModelManager._cache["models_json_pending"] == models_path:
+            return ModelManager._cache["models_json_data"]
+        
+        try:
+            cache_key = ModelManager._models_json_key(models_path)
+        except OSError:
+            cache_key = None
+        
         # Vérifier le cache d'abord
-        if ModelManager._is_cache_valid() and ModelManager._cache["models_json_data"]:
+        if cache_key and ModelManager._cache["models_json_key"] == cache_key:
             logger.debug("Utilisation du cache pour models.json")
             return ModelManager._cache["models_json_data"]
         
-        models_path = ModelManager.get_models_json_path()
-        logger.debug(f"Chargement du fichier: {models_path}")
+        logger.debug("Chargement du fichier: %s", models_path)
         
-        if not os.path.exists(models_path):
+        if cache_key is None:
             # Si le fichier n'existe pas, créer un fichier vide avec une structure de base
             try:
                 logger.info(f"Création d'un fichier models.json vide à {models_path}")
                 os.makedirs(os.path.dirname(models_path) or ".", exist_ok=True)
                 empty_data = {"config": {"BASE_DIR": ConfigService.get_base_dir()}, "groups": {}}
-                with open(models_path, "w", encoding="utf-8") as f:
-                    json.dump(empty_data, f, indent=2)
+                with open(models_path, "wb") as f:
+                    f.write(dumps_json(empty_data, indent=True))
                 
                 # Mettre en cache
                 ModelManager._cache["models_json_data"] = empty_data
-                ModelManager._cache["last_load_time"] = time.time()
+                ModelManager._cache["models_json_key"] = ModelManager._models_json_key(models_path)
                 return empty_data
             except Exception as e:
                 logger.error(f"Impossible de créer un fichier models.json vide: {str(e)}")
@@ -150,13 +233,12 @@ class ModelManager:
                 )
         
         try:
-            with open(models_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json_file(models_path)
             # Mettre en cache
             ModelManager._cache["models_json_data"] = data
-            ModelManager._cache["last_load_time"] = time.time()
+            ModelManager._cache["models_json_key"] = cache_key
             
-            logger.debug(f"Fichier models.json chargé avec succès depuis {models_path}")
+            logger.debug("Fichier models.json chargé avec succès depuis %s", models_path)
             return data
         except json.JSONDecodeError as e:
             logger.error(f"Erreur de décodage JSON: {str(e)}")
@@ -190,34 +272,181 @@ class ModelManager:
     @staticmethod
     def save_models_json(data: Dict) -> None:
         """
-        Sauvegarde le fichier models.json et invalide le cache
+        Sauvegarde le fichier models.json et met à jour le cache
         
-        **Description:** Saves the models.json file and invalidates the cache.
+        **Description:** Replaces the cached models.json data immediately and schedules the
+        disk write SAVE_DEBOUNCE_SECONDS later, so consecutive saves are coalesced into one
+        write. The content is serialized at save time, so later in-place changes to the
+        cached dict (such as 'exists' flags) never reach the file. If the previous write
+        failed, the data is written synchronously instead so the caller sees the error; a
+        change reported as failed is discarded and never written later.
+        Call flush_models_json to write pending changes right away.
         **Parameters:**
         - `data` (Dict): The model data structure to save
         **Returns:** None
+        **Raises:** HTTPException (500) if the data cannot be serialized or written
         """
         models_path = ModelManager.get_models_json_path()
-        logger.debug(f"Sauvegarde du fichier: {models_path}")
+        logger.debug("Sauvegarde du fichier: %s", models_path)
         
         try:
-            # Assurer que le répertoire existe
-            os.makedirs(os.path.dirname(models_path) or ".", exist_ok=True)
-            
             # Nettoyer les clés 'exists' avant sauvegarde
             cleaned_data = ModelManager._clean_exists_keys(data)
+            payload = dumps_json(cleaned_data, indent=True)
             
-            with open(models_path, "w", encoding="utf-8") as f:
-                json.dump(cleaned_data, f, indent=2)
-            
-            # Invalider le cache après sauvegarde
-            ModelManager._clear_cache()
-            
-            logger.debug(f"Fichier models.json sauvegardé avec succès à {models_path}")
+            with ModelManager._cache_lock:
+                # Changes pending for another location (BASE_DIR changed) are written first
+                pending_path = ModelManager._cache["models_json_pending"]
+                if pending_path and pending_path != models_path:
+                    ModelManager._write_pending_locked()
+                
+                previous_pending = ModelManager._cache["models_json_pending"]
+                previous_payload = ModelManager._cache["models_json_payload"]
+                ModelManager._cache["models_json_data"] = cleaned_data
+                ModelManager._cache["models_json_pending"] = models_path
+                ModelManager._cache["models_json_payload"] = payload
+                
+                if ModelManager._flush_failures:
+                    # The last write failed: don't report success for a change that may never land
+                    try:
+                        ModelManager._write_pending_locked()
+                    except OSError:
+                        # The change is reported as failed, so drop it and keep only the
+                        # changes accepted before it (the caller may have mutated the cached dict)
+                        ModelManager._cache["models_json_pending"] = previous_pending
+                        ModelManager._cache["models_json_payload"] = previous_payload
+                        if previous_pending:
+                            ModelManager._cache["models_json_data"] = loads_json(previous_payload)
+                        else:
+                            ModelManager._cache["models_json_data"] = None
+                            ModelManager._cache["models_json_key"] = None
+                        raise
+                elif ModelManager._flush_timer is None:
+                    ModelManager._schedule_flush_locked(ModelManager.SAVE_DEBOUNCE_SECONDS)
         except Exception as e:
             logger.error(f"Erreur lors de la sauvegarde du fichier: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Erreur lors de la sauvegarde du fichier: {str(e)}")
     
+    @staticmethod
+    def flush_models_json() -> bool:
+        """
+        Write pending models.json changes to disk.
+        
+        **Description:** Called by the debounce timer scheduled in save_models_json and on
+        application shutdown. Does nothing when there are no pending changes. On failure the
+        changes stay pending and another attempt is scheduled with an increasing delay.
+        **Parameters:** None
+        **Returns:** bool, False if pending changes could not be written
+        """
+        with ModelManager._cache_lock:
+            if ModelManager._flush_timer is not None:
+                ModelManager._flush_timer.cancel()
+                ModelManager._flush_timer = None
+            models_path = ModelManager._cache["models_json_pending"]
+            if not models_path:
+                return True
+            try:
+                ModelManager._write_pending_locked()
+            except OSError as e:
+                logger.error(f"Erreur lors de la sauvegarde du fichier {models_path}: {str(e)}")
+                return False
+            logger.debug("Fichier models.json sauvegardé avec succès à %s", models_path)
+            return True
+    
+    @staticmethod
+    def _schedule_flush_locked(delay: float) -> None:
+        """
+        Start the timer that flushes pending models.json changes. Must be called with
+        _cache_lock held and no timer running.
+        
+        **Description:** The timer thread is a daemon so it never blocks interpreter exit;
+        the application's shutdown handler flushes explicitly.
+        **Parameters:**
+        - `delay` (float): Seconds before the flush
+        **Returns:** None
+        """
+        timer = threading.Timer(delay, ModelManager.flush_models_json)
+        timer.daemon = True
+        ModelManager._flush_timer = timer
+        timer.start()
+    
+    @staticmethod
+    def _write_pending_locked() -> None:
+        """
+        Write the pending models.json snapshot. Must be called with _cache_lock held.
+        
+        **Description:** Clears the pending state on success. On failure the changes stay
+        pending and a retry is scheduled, backing off exponentially from
+        SAVE_DEBOUNCE_SECONDS up to SAVE_RETRY_MAX_SECONDS.
+        **Parameters:** None
+        **Returns:** None
+        **Raises:** OSError if the file cannot be written
+        """
+        models_path = ModelManager._cache["models_json_pending"]
+        try:
+            cache_key = ModelManager._write_models_json_locked(models_path, ModelManager._cache["models_json_payload"])
+        except OSError:
+            ModelManager._flush_failures += 1
+            if ModelManager._flush_timer is None:
+                delay = min(
+                    ModelManager.SAVE_DEBOUNCE_SECONDS * 2 ** ModelManager._flush_failures,
+                    ModelManager.SAVE_RETRY_MAX_SECONDS,
+                )
+                ModelManager._schedule_flush_locked(delay)
+            raise
+        
+        ModelManager._flush_failures = 0
+        ModelManager._cache["models_json_pending"] = None
+        ModelManager._cache["models_json_payload"] = None
+        ModelManager._cache["models_json_key"] = cache_key
+    
+    @staticmethod
+    def _write_models_json_locked(models_path: str, payload: bytes) -> tuple:
+        """
+        Atomically write models.json. Must be called with _cache_lock held.
+        
+        **Description:** Writes to a temporary file, fsyncs it and moves it over models.json
+        with os.replace, so a crash never leaves a truncated file behind. The write is
+        skipped when the content matches what was last written and the file has not
+        changed since.
+        **Parameters:**
+        - `models_path` (str): Full path to models.json
+        - `payload` (bytes): Serialized model data structure to write
+        **Returns:** tuple cache key of the file now on disk
+        **Raises:** OSError if the file cannot be written
+        """
+        written = ModelManager._cache["models_json_written"]
+        try:
+            unchanged = (
+                written is not None
+                and written[1] == payload
+                and written[0] == ModelManager._models_json_key(models_path)
+            )
+        except OSError:
+            unchanged = False
+        
+        if not unchanged:
+            os.makedirs(os.path.dirname(models_path) or ".", exist_ok=True)
+            tmp_path = f"{models_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, models_path)
+            
+            # Persist the rename itself; directories cannot be opened this way on Windows
+            if os.name == "posix":
+                dir_fd = os.open(os.path.dirname(models_path) or ".", os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            
+            written = (ModelManager._models_json_key(models_path), payload)
+            ModelManager._cache["models_json_written"] = written
+        
+        return written[0]
+    
     @staticmethod
     def resolve_path(path: str, base_dir: str) -> str:
         """
@@ -288,11 +517,8 @@ class ModelManager:
         if os.path.exists(target_dir) and os.path.isdir(target_dir):
             try:
                 logger.info(f"Mise à jour du dépôt git: {target_dir}")
-                # Se déplacer dans le répertoire et faire un pull
-                original_dir = os.getcwd()
-                os.chdir(target_dir)
-                result = subprocess.run(["git", "pull"], capture_output=True, text=True)
-                os.chdir(original_dir)
+                # Faire un pull dans le répertoire du dépôt (sans changer le répertoire courant du processus)
+                result = subprocess.run(["git", "pull"], cwd=target_dir, capture_output=True, text=True)
                 
                 if result.returncode == 0:
                     logger.info(f"Dépôt git mis à jour avec succès: {target_dir}")
@@ -467,9 +693,15 @@ class ModelManager:
                     logger.error(f"Erreur lors de l'installation de {model_id}: {message}")
                     report["errors"].append(f"Erreur lors de l'installation de {model_id}: {message}")
         
-        # Installer les workflows
-        for workflow_name in bundle_data.get("workflows", []):
-            success, message = ModelManager.copy_workflow_to_comfyui(workflow_name)
+        # Installer les workflows (copies indépendantes, exécutées en parallèle)
+        workflow_names = bundle_data.get("workflows", [])
+        if len(workflow_names) > 1:
+            with ThreadPoolExecutor(max_workers=min(ModelManager.WORKFLOW_COPY_WORKERS, len(workflow_names))) as executor:
+                copy_results = list(executor.map(ModelManager.copy_workflow_to_comfyui, workflow_names))
+        else:
+            copy_results = [ModelManager.copy_workflow_to_comfyui(name) for name in workflow_names]
+        
+        for workflow_name, (success, message) in zip(workflow_names, copy_results):
             if success:
                 report["installed"].append(f"workflow:{workflow_name}")
             else:
@@ -491,7 +723,6 @@ class ModelManager:
         """
         # Import here to avoid circular imports
         from .download_manager import DownloadManager
-        import requests
         
         url = model.get("url")
         dest = model.get("dest")
@@ -1,5 +1,6 @@
 import os
-from typing import Dict, List, Any
+import time
+from typing import Dict, Iterable, List, Any
 from .model_manager import ModelManager
 from .download_service import DownloadService
 from .config_service import ConfigService
@@ -24,6 +25,13 @@ class ModelService:
     For complex model management use ModelManagementService.
     """
     
+    # dest -> resolved path, valid while models.json data and base_dir are unchanged
+    _resolved_dest_cache = {"groups": None, "base_dir": None, "paths": {}}
+    
+    # path -> (total_size, computed_at); disk usage changes slowly and the UI polls it
+    _total_size_cache: Dict[str, tuple] = {}
+    TOTAL_SIZE_TTL = 60
+    
     @staticmethod
     def load_models() -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -50,12 +58,18 @@ class ModelService:
         base_dir = ConfigService.get_base_dir()
         result = []
         
+        # Stat each directory in a single pass
+        resolved_paths = ModelService.resolve_dests(groups, base_dir)
+        dir_listings = ModelService.scan_parent_directories(resolved_paths.values())
+        
         for group, entries in groups.items():
             for entry in entries:
                 dest = entry.get("dest")
-                # Replace ${BASE_DIR} with the path determined above
-                path = dest.replace("${BASE_DIR}", base_dir) if dest else None
-                exists = os.path.exists(path) if path else False
+                path = resolved_paths.get(dest) if dest else None
+                actual_size = None
+                if path:
+                    actual_size = dir_listings.get(os.path.dirname(path), {}).get(os.path.basename(path))
+                exists = actual_size is not None
                 model_id = DownloadService.get_model_id(entry)
                 progress = DownloadService.get_progress(model_id)
                 
@@ -66,24 +80,16 @@ class ModelService:
                 
                 # Check disk size if model exists and expected size is defined
                 if exists and entry.get("size") is not None:
-                    try:
-                        actual_size = os.path.getsize(path)
-                        expected_size = entry.get("size")
-                        if actual_size != expected_size:
-                            # Add "incorrect size" if not already present
-                            tags = entry_with_tags["tags"]
-                            if "incorrect size" not in tags:
-                                tags.append("incorrect size")
-                        else:
-                            # Remove "incorrect size" if size is correct and tag is present
-                            tags = entry_with_tags["tags"]
-                            if "incorrect size" in tags:
-                                tags.remove("incorrect size")
-                    except Exception:
-                        # If error reading size, add the tag
-                        tags = entry_with_tags["tags"]
+                    expected_size = entry.get("size")
+                    tags = entry_with_tags["tags"]
+                    if actual_size != expected_size:
+                        # Add "incorrect size" if not already present
                         if "incorrect size" not in tags:
                             tags.append("incorrect size")
+                    else:
+                        # Remove "incorrect size" if size is correct and tag is present
+                        if "incorrect size" in tags:
+                            tags.remove("incorrect size")
                 
                 result.append({
                     "group": group,
@@ -95,24 +101,94 @@ class ModelService:
         
         return result
 
+    @staticmethod
+    def resolve_dests(groups: Dict[str, List[Dict[str, Any]]], base_dir: str) -> Dict[str, str]:
+        """
+        Resolve ${BASE_DIR} in every entry destination.
+        
+        **Description:** The mapping is computed once per loaded models.json and base directory;
+        ModelManager hands back the same cached groups object until the file changes on disk.
+        **Parameters:**
+        - `groups` (Dict[str, List[Dict[str, Any]]]): Model groups from models.json
+        - `base_dir` (str): Base directory substituted for ${BASE_DIR}
+        **Returns:** Dict mapping each raw dest to its resolved path
+        """
+        cache = ModelService._resolved_dest_cache
+        if cache["groups"] is groups and cache["base_dir"] == base_dir:
+            paths = cache["paths"]
+        else:
+            paths = {}
+            ModelService._resolved_dest_cache = {"groups": groups, "base_dir": base_dir, "paths": paths}
+        
+        # Also picks up entries added in place since the mapping was built
+        for entries in groups.values():
+            for entry in entries:
+                dest = entry.get("dest")
+                if dest and dest not in paths:
+                    paths[dest] = dest.replace("${BASE_DIR}", base_dir)
+        return paths
+
+    @staticmethod
+    def scan_parent_directories(paths: Iterable[str]) -> Dict[str, Dict[str, int]]:
+        """
+        Collect file sizes for the parent directories of the given paths.
+        
+        **Description:** Runs one os.scandir pass per distinct parent directory instead of
+        one stat per path. Missing directories and unreadable entries are skipped.
+        **Parameters:**
+        - `paths` (Iterable[str]): Resolved file or directory paths
+        **Returns:** Dict mapping each parent directory to a {name: size} dict
+        """
+        listings: Dict[str, Dict[str, int]] = {}
+        for directory in {os.path.dirname(p) for p in paths}:
+            sizes: Dict[str, int] = {}
+            try:
+                with os.scandir(directory or ".") as it:
+                    for dir_entry in it:
+                        try:
+                            sizes[dir_entry.name] = dir_entry.stat().st_size
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            listings[directory] = sizes
+        return listings
+
     @staticmethod
     def get_total_directory_size(path: str) -> int:
         """
         Calculate the total size of a directory.
         
-        **Description:** Recursively calculates the total size of all files in a directory.
+        **Description:** Recursively calculates the total size of all files in a directory
+        with an explicit os.scandir stack. Symlinked directories are not descended into.
+        Results are cached for TOTAL_SIZE_TTL seconds.
         **Parameters:**
         - `path` (str): Directory path to calculate size for
         **Returns:** int containing the total size in bytes
         """
+        now = time.monotonic()
+        cached = ModelService._total_size_cache.get(path)
+        if cached and now - cached[1] < ModelService.TOTAL_SIZE_TTL:
+            return cached[0]
+        
         total = 0
-        for dirpath, dirnames, filenames in os.walk(path):
-            for f in filenames:
-                fp = os.path.join(dirpath, f)
-                try:
-                    total += os.path.getsize(fp)
-                except Exception:
-                    pass
+        stack = [path]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file():
+                                total += entry.stat().st_size
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+        
+        ModelService._total_size_cache[path] = (total, now)
         return total
 
     @staticmethod
@@ -1,6 +1,7 @@
 import os
+import re
+import threading
 from typing import Dict, Optional, Tuple
-from .model_manager import ModelManager
 from .config_service import ConfigService
 from ..utils.logger import get_logger
 
@@ -9,6 +10,7 @@ logger = get_logger(__name__)
 
 # Constants
 ENV_FILE = ".env"
+ENV_TOKEN_PATTERN = re.compile(r"^(HF_TOKEN|CIVITAI_TOKEN)=(.*)$", re.MULTILINE)
 
 
 class TokenService:
@@ -27,6 +29,10 @@ class TokenService:
     model operations (use ModelManager).
     """
     
+    # Parsed tokens keyed on (path, mtime_ns) of the .env file
+    _env_cache = {"key": None, "tokens": (None, None)}
+    _env_cache_lock = threading.Lock()
+
     @staticmethod
     def get_env_file_path() -> str:
         """
@@ -36,7 +42,7 @@ class TokenService:
         **Parameters:** None
         **Returns:** str containing the path to the .env file
         """
-        return ModelManager.get_env_file_path()
+        return ConfigService.get_env_file_path()
 
     @staticmethod
     def write_env_file(hf_token: Optional[str], civitai_token: Optional[str]) -> None:
@@ -56,8 +62,11 @@ class TokenService:
             lines.append(f"CIVITAI_TOKEN={civitai_token}")
         env_path = ConfigService.get_env_file_path()
         os.makedirs(os.path.dirname(env_path), exist_ok=True)
-        with open(env_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        with TokenService._env_cache_lock:
+            with open(env_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines))
+            TokenService._env_cache["key"] = (env_path, os.stat(env_path).st_mtime_ns)
+            TokenService._env_cache["tokens"] = (hf_token, civitai_token)
 
     @staticmethod
     def read_env_file() -> Tuple[Optional[str], Optional[str]]:
@@ -65,19 +74,26 @@ class TokenService:
         Reads tokens from the .env file.
         
         **Description:** Loads authentication tokens from the environment file.
+        The file is only re-parsed when its modification time changes.
         **Parameters:** None
         **Returns:** Tuple of (hf_token, civitai_token) strings or None values
         """
-        hf_token = None
-        civitai_token = None
         env_path = ConfigService.get_env_file_path()
-        if os.path.exists(env_path):
+        try:
+            cache_key = (env_path, os.stat(env_path).st_mtime_ns)
+        except OSError:
+            return None, None
+        
+        with TokenService._env_cache_lock:
+            if TokenService._env_cache["key"] == cache_key:
+                return TokenService._env_cache["tokens"]
+            
             with open(env_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.startswith("HF_TOKEN="):
-                        hf_token = line.strip().split("=", 1)[1]
-                    elif line.startswith("CIVITAI_TOKEN="):
-                        civitai_token = line.strip().split("=", 1)[1]
+                tokens = {key: value.strip() for key, value in ENV_TOKEN_PATTERN.findall(f.read())}
+            hf_token = tokens.get("HF_TOKEN")
+            civitai_token = tokens.get("CIVITAI_TOKEN")
+            TokenService._env_cache["key"] = cache_key
+            TokenService._env_cache["tokens"] = (hf_token, civitai_token)
         return hf_token, civitai_token
 
     @staticmethod
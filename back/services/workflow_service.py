@@ -252,12 +252,12 @@ class WorkflowService:
         """
         file_path = os.path.join(self.workflows_dir, filename)
         
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Workflow '{filename}' not found")
-        
+        # Single unlink instead of an existence check followed by a second path lookup
         try:
             os.remove(file_path)
             logger.info(f"Workflow '{filename}' deleted successfully")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Workflow '{filename}' not found")
         except Exception as e:
             logger.error(f"Error deleting workflow {filename}: {e}")
             raise
@@ -0,0 +1,74 @@
+"""
+Tests for the JSON models router
+
+These tests validate the bulk model entry endpoint against an in-memory models.json.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from back.routers import json_models_router
+from back.services.auth_middleware import protected
+from back.services.json_models_service import JsonModelsService
+from back.services.model_manager import ModelManager
+
+
+# Create a test app
+def create_test_app():
+    """Create a test FastAPI app with the JSON models router and authentication bypassed."""
+    app = FastAPI()
+    app.include_router(json_models_router.router)
+    app.dependency_overrides[protected] = lambda: {"user_id": "test_user"}
+    return app
+
+
+@pytest.fixture
+def models_data(monkeypatch):
+    """Serve an in-memory models.json to the router's service and record its saves."""
+    data = {
+        "config": {},
+        "groups": {"g": [{"dest": "${BASE_DIR}/models/a.safetensors", "url": "http://old"}]}
+    }
+    saves = []
+    monkeypatch.setattr(ModelManager, "load_models_json", staticmethod(lambda: data))
+    monkeypatch.setattr(ModelManager, "save_models_json", staticmethod(saves.append))
+    monkeypatch.setattr("back.services.json_models_service.ConfigService.get_base_dir",
+                        staticmethod(lambda: "/base"))
+    monkeypatch.setattr(json_models_router, "json_models_service", JsonModelsService())
+    return data, saves
+
+
+@pytest.fixture
+def client(models_data):
+    """Create a test client."""
+    return TestClient(create_test_app())
+
+
+def test_bulk_entries_saves_once(client, models_data):
+    """Test that the bulk endpoint updates, adds and rejects entries with a single save."""
+    data, saves = models_data
+
+    response = client.post("/api/jsonmodels/entries/bulk", json=[
+        {"group": "g", "entry": {"dest": "${BASE_DIR}/models/a.safetensors", "url": "http://new"}},
+        {"group": "g", "entry": {"dest": "${BASE_DIR}/models/b.safetensors"}},
+        {"group": "g", "entry": {"url": "http://no-id"}},
+    ])
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["message"] == "2 of 3 model entries saved"
+    assert [r["ok"] for r in body["results"]] == [True, True, False]
+    assert data["groups"]["g"][0]["url"] == "http://new"
+    assert len(data["groups"]["g"]) == 2
+    assert len(saves) == 1
+
+
+def test_bulk_entries_rejects_invalid_body(client, models_data):
+    """Test that a body that is not a list of entry requests is refused without saving."""
+    _, saves = models_data
+
+    response = client.post("/api/jsonmodels/entries/bulk", json={"group": "g"})
+
+    assert response.status_code == 422
+    assert saves == []
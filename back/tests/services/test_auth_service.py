@@ -1,6 +1,7 @@
 import pytest
 import tempfile
 import os
+from unittest.mock import patch
 from back.services.auth_service import AuthService
 
 
@@ -79,3 +80,44 @@ class TestAuthService:
         # Invalid token should return None
         invalid_decoded = AuthService.decode_jwt("invalid_token")
         assert invalid_decoded is None
+    
+    def test_decode_jwt_uses_cache(self):
+        """
+        Test JWT decode caching.
+        
+        **Description:** Verifies that a repeated decode of the same token skips PyJWT.
+        **Parameters:** None
+        **Returns:** None (test assertion)
+        """
+        token = AuthService.create_jwt("cached_user")
+        assert AuthService.decode_jwt(token) == "cached_user"
+        
+        with patch("back.services.auth_service.jwt.decode") as mock_decode:
+            assert AuthService.decode_jwt(token) == "cached_user"
+            mock_decode.assert_not_called()
+    
+    def test_load_users_reloads_on_change(self):
+        """
+        Test users.json caching.
+        
+        **Description:** Verifies that cached users are isolated from callers and refreshed when the file changes.
+        **Parameters:** None
+        **Returns:** None (test assertion)
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch.dict(os.environ, {"COMFYUI_MODEL_DIR": temp_dir}):
+                users = AuthService.load_users()
+                assert list(users) == ["admin"]
+                
+                # Mutating the returned dict must not leak into the cache
+                users["intruder"] = "x"
+                assert "intruder" not in AuthService.load_users()
+                
+                users_path = AuthService.get_users_file_path()
+                with open(users_path, "w", encoding="utf-8") as f:
+                    f.write('{"other": "%s"}' % AuthService.hash_password("pwd"))
+                stat = os.stat(users_path)
+                os.utime(users_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+                
+                assert list(AuthService.load_users()) == ["other"]
+                assert AuthService.verify_user("other", "pwd") is True
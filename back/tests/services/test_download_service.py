@@ -1,5 +1,10 @@
+import subprocess
+import sys
+import threading
+
 import pytest
 from unittest.mock import patch, MagicMock
+from back.services.download_manager import DownloadManager
 from back.services.download_service import DownloadService
 
 
@@ -55,3 +60,35 @@ class TestDownloadService:
         
         expected = {"ok": False, "msg": "No active download for this model"}
         assert result == expected
+    
+    def test_wait_for_process_stop_terminates_running_process(self):
+        """
+        Test that a stop request terminates a running process.
+        
+        **Description:** Verifies that wait_for_process reports the stop when it had to
+        terminate the process.
+        **Parameters:** None
+        **Returns:** None (test assertion)
+        """
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        stop_event = threading.Event()
+        stop_event.set()
+        
+        assert DownloadManager.wait_for_process(proc, stop_event) is True
+        assert proc.returncode != 0
+    
+    def test_wait_for_process_ignores_stop_after_exit(self):
+        """
+        Test that a stop requested after the process finished is not reported.
+        
+        **Description:** A process that already exited successfully, such as a complete
+        git clone, must not be treated as stopped.
+        **Parameters:** None
+        **Returns:** None (test assertion)
+        """
+        proc = subprocess.Popen([sys.executable, "-c", "pass"])
+        proc.wait()
+        stop_event = threading.Event()
+        stop_event.set()
+        
+        assert DownloadManager.wait_for_process(proc, stop_event) is False
@@ -0,0 +1,143 @@
+import pytest
+
+from back.services.json_models_service import JsonModelsService
+from back.services.model_manager import ModelManager
+
+
+@pytest.fixture
+def models_data(monkeypatch):
+    """
+    Serve an in-memory models.json to ModelManager and record its saves.
+
+    **Description:** Replaces load_models_json and save_models_json so no file is touched.
+    The group "g" already holds one entry identified by its dest.
+    **Parameters:**
+    - `monkeypatch` (MonkeyPatch): pytest monkeypatch fixture
+    **Returns:** Tuple of the models data dict and the list of saved payloads
+    """
+    data = {
+        "config": {},
+        "groups": {"g": [{"dest": "${BASE_DIR}/models/a.safetensors", "url": "http://old"}]}
+    }
+    saves = []
+    monkeypatch.setattr(ModelManager, "load_models_json", staticmethod(lambda: data))
+    monkeypatch.setattr(ModelManager, "save_models_json", staticmethod(saves.append))
+    return data, saves
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """
+    Create a JsonModelsService with a fixed base directory.
+
+    **Description:** Avoids resolving BASE_DIR from the environment or config files.
+    **Parameters:**
+    - `monkeypatch` (MonkeyPatch): pytest monkeypatch fixture
+    **Returns:** JsonModelsService instance
+    """
+    monkeypatch.setattr("back.services.json_models_service.ConfigService.get_base_dir",
+                        staticmethod(lambda: "/base"))
+    return JsonModelsService()
+
+
+class TestUpdateModelEntries:
+    """
+    Test cases for JsonModelsService.update_model_entries.
+
+    **Description:** Covers adds and updates in one batch, duplicates, rejected entries
+    and the single write of models.json.
+    """
+
+    def test_adds_and_updates_in_one_batch(self, service, models_data):
+        """
+        Test that a batch can both update an existing entry and add new ones.
+
+        **Description:** Updates the existing entry of "g", adds one to "g" and one to a
+        new group, then checks the results and the saved data.
+        **Parameters:** None
+        **Returns:** None (test assertion)
+        """
+        data, saves = models_data
+
+        result = service.update_model_entries([
+            ("g", {"dest": "${BASE_DIR}/models/a.safetensors", "url": "http://new"}),
+            ("g", {"dest": "${BASE_DIR}/models/b.safetensors"}),
+            ("h", {"git": "https://example.com/node.git"}),
+        ])
+
+        assert result["ok"] is True
+        assert result["message"] == "3 of 3 model entries saved"
+        assert [r["message"] for r in result["results"]] == [
+            "Model entry updated", "Model entry added", "Model entry added"
+        ]
+        assert data["groups"]["g"] == [
+            {"dest": "${BASE_DIR}/models/a.safetensors", "url": "http://new"},
+            {"dest": "${BASE_DIR}/models/b.safetensors"},
+        ]
+        assert data["groups"]["h"] == [{"git": "https://example.com/node.git"}]
+        assert saves == [data]
+
+    def test_duplicate_ids_in_one_batch(self, service, models_data):
+        """
+        Test that a repeated id in a batch updates the entry added earlier in it.
+
+        **Description:** Adds an entry and sends it again with other data; the group must
+        hold a single entry with the last data.
+        **Parameters:** None
+        **Returns:** None (test assertion)
+        """
+        data, saves = models_data
+
+        result = service.update_model_entries([
+            ("g", {"dest": "${BASE_DIR}/models/b.safetensors", "url": "http://first"}),
+            ("g", {"dest": "${BASE_DIR}/models/b.safetensors", "url": "http://second"}),
+        ])
+
+        assert [r["message"] for r in result["results"]] == [
+            "Model entry added", "Model entry updated"
+        ]
+        assert data["groups"]["g"][1:] == [
+            {"dest": "${BASE_DIR}/models/b.safetensors", "url": "http://second"}
+        ]
+        assert len(saves) == 1
+
+    def test_entry_without_identifier_is_rejected(self, service, models_data):
+        """
+        Test that an entry without dest or git fails alone.
+
+        **Description:** The invalid entry is reported as failed while the other entry of
+        the batch is still saved, with a normalized dest.
+        **Parameters:** None
+        **Returns:** None (test assertion)
+        """
+        data, saves = models_data
+
+        result = service.update_model_entries([
+            ("g", {"url": "http://no-id"}),
+            ("g", {"dest": "/base/models/c.safetensors"}),
+        ])
+
+        assert result["message"] == "1 of 2 model entries saved"
+        assert result["results"][0] == {
+            "group": "g", "ok": False, "message": "Entry must have either dest or git field"
+        }
+        assert result["results"][1]["ok"] is True
+        assert result["results"][1]["id"] == "${BASE_DIR}/models/c.safetensors"
+        assert len(data["groups"]["g"]) == 2
+        assert len(saves) == 1
+
+    def test_nothing_saved_when_all_entries_rejected(self, service, models_data):
+        """
+        Test that models.json is not written when no entry is valid.
+
+        **Description:** A batch of rejected entries must leave the file untouched.
+        **Parameters:** None
+        **Returns:** None (test assertion)
+        """
+        _, saves = models_data
+
+        result = service.update_model_entries([("g", {"url": "http://no-id"})])
+
+        assert result["message"] == "0 of 1 model entries saved"
+        assert saves == []
+
@@ -0,0 +1,226 @@
+import json
+import os
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from back.services.file_manager_service import FileManagerService
+from back.services.model_manager import ModelManager
+
+
+@pytest.fixture
+def models_path(tmp_path, monkeypatch):
+    """
+    Point ModelManager at a temporary models.json with a fresh cache.
+
+    **Description:** The debounce is made long enough that only explicit flushes write,
+    unless a test shortens it. Pending timers are cancelled afterwards.
+    **Parameters:**
+    - `tmp_path` (Path): pytest temporary directory
+    - `monkeypatch` (MonkeyPatch): pytest monkeypatch fixture
+    **Returns:** str path of the temporary models.json
+    """
+    path = str(tmp_path / "models.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"config": {}, "groups": {}}, f)
+
+    monkeypatch.setattr(ModelManager, "get_models_json_path", staticmethod(lambda: path))
+    monkeypatch.setattr(ModelManager, "SAVE_DEBOUNCE_SECONDS", 60)
+    monkeypatch.setattr(ModelManager, "_flush_failures", 0)
+    for key in ("models_json_data", "models_json_key", "models_json_pending",
+                "models_json_payload", "models_json_written"):
+        monkeypatch.setitem(ModelManager._cache, key, None)
+
+    yield path
+
+    if ModelManager._flush_timer is not None:
+        ModelManager._flush_timer.cancel()
+        ModelManager._flush_timer = None
+
+
+def read_groups(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["groups"]
+
+
+class TestModelManagerSave:
+    """
+    Test cases for the debounced models.json writer of ModelManager.
+
+    **Description:** Covers coalescing, snapshots, shutdown flush and write failures.
+    """
+
+    def test_saves_are_coalesced(self, models_path, monkeypatch):
+        """
+        Test that a burst of saves results in a single write.
+
+        **Description:** Saves five times, waits for the debounce timer and checks that
+        exactly one write happened with the last content.
+        **Parameters:** None
+        **Returns:** None (test assertion)
+        """
+        monkeypatch.setattr(ModelManager, "SAVE_DEBOUNCE_SECONDS", 0.05)
+        writes = []
+        original_write = ModelManager._write_models_json_locked
+
+        def counting_write(path, payload):
+            writes.append(path)
+            return original_write(path, payload)
+
+        monkeypatch.setattr(ModelManager, "_write_models_json_locked", staticmethod(counting_write))
+
+        for i in range(5):
+            data = ModelManager.load_models_json()
+            data["groups"].setdefault("g", []).append({"dest": f"model_{i}"})
+            ModelManager.save_models_json(data)
+
+        # Reads see the saved data before it reaches the disk
+        assert len(ModelManager.load_models_json()["groups"]["g"]) == 5
+        assert read_groups(models_path) == {}
+
+        deadline = time.time() + 5
+        while ModelManager._cache["models_json_pending"] and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert writes == [models_path]
+        assert len(read_groups(models_path)["g"]) == 5
+
+    def test_flush_writes_snapshot_taken_at_save(self, models_path):
+        """
+        Test that in-place changes after a save are not written.
+
+        **Description:** Readers annotate the cached dict with 'exists' flags; those must
+        not end up in models.json when the pending save is flushed.
+        **Parameters:** None
+        **Returns:** None (test assertion)
+        """
+        data = ModelManager.load_models_json()
+        data["groups"]["g"] = [{"dest": "model"}]
+        ModelManager.save_models_json(data)
+
+        for entry in ModelManager.load_models_json()["groups"]["g"]:
+            entry["exists"] = False
+
+        assert ModelManager.flush_models_json() is True
+        assert read_groups(models_path) == {"g": [{"dest": "model"}]}
+
+    def test_shutdown_flushes_pending_changes(self, models_path, monkeypatch):
+        """
+        Test that the application's shutdown handler writes pending changes.
+
+        **Description:** Saves without waiting for the debounce timer, then runs the
+        shutdown event of the FastAPI application.
+        **Parameters:** None
+        **Returns:** None (test assertion)
+        """
+        # main.py mounts front/dist/assets relative to the working directory
+        monkeypatch.chdir(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+        from main import shutdown_event
+
+        data = ModelManager.load_models_json()
+        data["groups"]["g"] = []
+        ModelManager.save_models_json(data)
+        assert read_groups(models_path) == {}
+
+        shutdown_event()
+
+        assert read_groups(models_path) == {"g": []}
+        assert ModelManager._cache["models_json_pending"] is None
+        assert ModelManager._flush_timer is None
+
+    def test_failed_flush_keeps_changes_pending_and_retries(self, models_path):
+        """
+        Test the background failure path.
+
+        **Description:** A failed flush keeps the changes pending and schedules another
+        attempt; once the disk accepts writes again the retry succeeds.
+        **Parameters:** None
+        **Returns:** None (test assertion)
+        """
+        os.mkdir(f"{models_path}.tmp")  # blocks the temporary file
+
+        data = ModelManager.load_models_json()
+        data["groups"]["g"] = []
+        ModelManager.save_models_json(data)
+
+        assert ModelManager.flush_models_json() is False
+        assert ModelManager._cache["models_json_pending"] == models_path
+        assert ModelManager._flush_timer is not None
+        assert read_groups(models_path) == {}
+
+        os.rmdir(f"{models_path}.tmp")
+        assert ModelManager.flush_models_json() is True
+        assert read_groups(models_path) == {"g": []}
+        assert ModelManager._flush_failures == 0
+
+    def test_save_after_failed_flush_reports_error(self, models_path):
+        """
+        Test that a write failure reaches the next caller.
+
+        **Description:** After a failed flush the next save writes synchronously and raises
+        HTTPException while the disk still refuses writes. That change is discarded: neither
+        readers nor later writes see it, while the changes accepted before it are kept.
+        **Parameters:** None
+        **Returns:** None (test assertion)
+        """
+        os.mkdir(f"{models_path}.tmp")
+
+        data = ModelManager.load_models_json()
+        data["groups"]["g"] = []
+        ModelManager.save_models_json(data)
+        assert ModelManager.flush_models_json() is False
+
+        data = ModelManager.load_models_json()
+        data["groups"]["h"] = []
+        with pytest.raises(HTTPException) as exc_info:
+            ModelManager.save_models_json(data)
+        assert exc_info.value.status_code == 500
+        assert ModelManager.load_models_json()["groups"] == {"g": []}
+
+        os.rmdir(f"{models_path}.tmp")
+        assert ModelManager.flush_models_json() is True
+        assert read_groups(models_path) == {"g": []}
+
+    def test_failed_save_without_pending_changes_reloads_file(self, models_path):
+        """
+        Test that a discarded change is not served from the cache.
+
+        **Description:** When nothing else was pending, a save that fails synchronously
+        leaves readers with the content of models.json on disk.
+        **Parameters:** None
+        **Returns:** None (test assertion)
+        """
+        os.mkdir(f"{models_path}.tmp")
+        ModelManager._flush_failures = 1
+
+        data = ModelManager.load_models_json()
+        data["groups"]["h"] = []
+        with pytest.raises(HTTPException):
+            ModelManager.save_models_json(data)
+
+        assert ModelManager._cache["models_json_pending"] is None
+        assert ModelManager.load_models_json()["groups"] == {}
+        os.rmdir(f"{models_path}.tmp")
+
+    def test_file_manager_sees_pending_changes(self, models_path, monkeypatch, tmp_path):
+        """
+        Test that model registrations include saves not yet written to disk.
+
+        **Description:** The file manager reads models.json through ModelManager, so a model
+        registered by a pending save is listed as registered before the flush.
+        **Parameters:** None
+        **Returns:** None (test assertion)
+        """
+        monkeypatch.setattr(FileManagerService, "_registered_cache",
+                            {"key": None, "data": None, "entries": None, "directories": frozenset()})
+        file_manager = FileManagerService()
+        file_manager.base_dir = str(tmp_path)
+        assert file_manager.get_registered_paths() == {}
+
+        data = ModelManager.load_models_json()
+        data["groups"]["g"] = [{"dest": "${BASE_DIR}/models/model.safetensors"}]
+        ModelManager.save_models_json(data)
+        assert read_groups(models_path) == {}
+
+        assert list(file_manager.get_registered_paths()) == [str(tmp_path / "models" / "model.safetensors")]
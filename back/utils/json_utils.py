@@ -0,0 +1,84 @@
+"""
+JSON file helpers.
+
+Uses orjson for parsing when it is installed and falls back to the standard
+library json module otherwise.
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def load_json_file(path: str) -> Any:
+    """
+    Parse a JSON file.
+
+    **Description:** Reads the file as bytes and parses it with orjson when available.
+    Parse errors raise json.JSONDecodeError in both cases (orjson's error subclasses it).
+    **Parameters:**
+    - `path` (str): Path to the JSON file
+    **Returns:** The decoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def loads_json(data: Any) -> Any:
+    """
+    Parse a JSON document held in memory.
+
+    **Description:** Same parser selection as load_json_file, for bytes or str input.
+    **Parameters:**
+    - `data` (bytes | str): JSON document
+    **Returns:** The decoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    **Description:** Uses orjson when available. With `indent` the output is indented by
+    two spaces, like json.dumps(indent=2). Non-ASCII characters are written as UTF-8.
+    **Parameters:**
+    - `obj` (Any): Object to serialize
+    - `indent` (bool): Whether to pretty-print the output
+    **Returns:** bytes containing the JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with dumps_json.
+
+    **Description:** Drop-in replacement for JSONResponse that serializes with orjson's C
+    encoder when it is installed, for routes returning large listings.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serialize the response body.
+
+        **Description:** Encodes the already JSON-compatible content produced by FastAPI.
+        **Parameters:**
+        - `content` (Any): Response content
+        **Returns:** bytes containing the JSON document
+        """
+        return dumps_json(content)
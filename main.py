@@ -111,6 +111,11 @@ async def startup_event():
     except ImportError:
         logger.error("Impossible d'importer get_models_json_path")
 
+@app.on_event("shutdown")
+def shutdown_event():
+    # Écrire les modifications de models.json encore en attente
+    ModelManager.flush_models_json()
+
 # Monter d'abord les fichiers statiques pour qu'ils soient prioritaires
 app.mount("/assets", StaticFiles(directory="front/dist/assets"), name="assets")
 